@@ -10,15 +10,20 @@ Routes handle:
 """
 from __future__ import annotations
 
+import hashlib
 import logging
+import tempfile
+import threading
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
 
 from app.core.config import Settings, get_settings
 from app.core.exceptions import AnalyzerError
 from app.schemas.resume import (
     HealthResponse,
+    JobDescription,
     MatchRequest,
     MatchResult,
     ScoreBreakdown,
@@ -31,13 +36,25 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Upload streaming: read in 1 MiB chunks, keep files up to 8 MiB in memory
+_UPLOAD_CHUNK_SIZE = 1 << 20
+_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+# Read once at import — Settings is frozen, so per-request get_settings()
+# + Pydantic attribute access in hot handlers is avoidable overhead
+_CACHE_TTL_SECONDS = get_settings().cache_ttl_seconds
+
 
 def get_orchestrator() -> Orchestrator:
     """
-    Provide the singleton Orchestrator instance.
+    Provide the Orchestrator instance.
 
     We lazily import and wire dependencies here rather than at module level
     to avoid import-time side effects (model loading etc.).
+
+    The FAISS ontology index is built at application startup (see lifespan
+    in app.main) rather than here, so the first request never pays for it;
+    SkillNormalizer.normalize still self-initializes as a fallback.
     """
     from app.core.dependencies import (
         get_graph_service,
@@ -48,30 +65,30 @@ def get_orchestrator() -> Orchestrator:
         get_skill_normalizer,
     )
 
-    # Initialize the skill normalizer (builds FAISS index on first call)
-    normalizer = get_skill_normalizer()
-    normalizer.initialize()
-
     return Orchestrator(
         parser=get_resume_parser(),
         extractor=get_skill_extractor(),
-        normalizer=normalizer,
+        normalizer=get_skill_normalizer(),
         sbert=get_sbert_service(),
         graph_service=get_graph_service(),
         scoring_engine=get_scoring_engine(),
     )
 
 
-# Cache the orchestrator singleton
-_orchestrator_instance: Orchestrator | None = None
+# lru_cache alone doesn't stop two threads from both running the factory
+# on a cold start; the lock makes construction happen exactly once.
+_orchestrator_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _build_orchestrator() -> Orchestrator:
+    return get_orchestrator()
 
 
 def _get_orchestrator() -> Orchestrator:
-    """Cached orchestrator dependency."""
-    global _orchestrator_instance
-    if _orchestrator_instance is None:
-        _orchestrator_instance = get_orchestrator()
-    return _orchestrator_instance
+    """Cached orchestrator dependency (singleton, same pattern as core.dependencies)."""
+    with _orchestrator_lock:
+        return _build_orchestrator()
 
 
 @router.post("/upload_resume", response_model=UploadResponse)
@@ -89,22 +106,43 @@ async def upload_resume(
         raise HTTPException(status_code=400, detail="Filename is required")
 
     try:
-        content = await file.read()
-        resume = await orchestrator.process_resume(content, file.filename)
-        return UploadResponse(
+        # Stream the upload in chunks instead of reading the whole body
+        # into one bytes object. Small files stay in memory; anything over
+        # the spool threshold spills to disk transparently.
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY) as spooled:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                spooled.write(chunk)
+            spooled.seek(0)
+            resume = await orchestrator.process_resume(spooled, file.filename)
+        # model_construct: server-built from trusted data, skip validation
+        return UploadResponse.model_construct(
             resume_id=resume.resume_id,
             filename=resume.filename,
             skill_count=len(resume.skills),
             experience_years=resume.experience_years,
         )
     except AnalyzerError as exc:
-        logger.error("Upload failed: %s", exc.message)
+        # Expected 4xx-class failure — no traceback capture
+        logger.warning("Upload failed: %s", exc.message)
         raise HTTPException(status_code=422, detail=exc.message) from exc
     except Exception as exc:
         logger.exception("Unexpected error during upload")
         raise HTTPException(status_code=500, detail="Internal server error") from exc
 
 
+def _match_cache_key(resume_id: str, jd: JobDescription) -> str:
+    """Deterministic cache key for a (resume, job description) pair."""
+    payload = "|".join((
+        resume_id,
+        jd.title,
+        jd.description,
+        ",".join(sorted(jd.required_skills)),
+        ",".join(sorted(jd.preferred_skills)),
+        str(jd.min_experience_years),
+    ))
+    return "match:" + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
 @router.post("/match", response_model=MatchResult)
 async def match_resume(
     request: MatchRequest,
@@ -114,9 +152,26 @@ async def match_resume(
     Match a previously uploaded resume against a job description.
 
     Returns a detailed fit score with skill-level breakdown and explanation.
+    Identical (resume, job description) pairs are served from Redis when
+    available — users tweaking unrelated UI state re-send the same pair
+    constantly, and a hit skips the whole scoring pipeline.
     """
+    from app.core.dependencies import get_redis_client
+
+    jd = request.job_description
+    redis_client = get_redis_client()
+    cache_key = _match_cache_key(request.resume_id, jd) if redis_client else None
+
+    if redis_client is not None:
+        try:
+            cached = await redis_client.get(cache_key)
+        except Exception as exc:
+            logger.debug("Match cache read failed: %s", exc)
+            cached = None
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
     try:
-        jd = request.job_description
         result = await orchestrator.match_resume_to_job(
             resume_id=request.resume_id,
             job_title=jd.title,
@@ -126,12 +181,14 @@ async def match_resume(
             min_experience_years=jd.min_experience_years,
         )
 
-        return MatchResult(
+        # model_construct throughout: these are server-built from trusted
+        # pipeline output, so the Pydantic validation pass is pure overhead
+        match_result = MatchResult.model_construct(
             resume_id=request.resume_id,
             job_title=jd.title,
             overall_score=result.overall,
             fit_label=result.fit_label,
-            score_breakdown=ScoreBreakdown(
+            score_breakdown=ScoreBreakdown.model_construct(
                 semantic_score=result.semantic_score,
                 graph_score=result.graph_score,
                 experience_score=result.experience_score,
@@ -140,14 +197,27 @@ async def match_resume(
                 experience_weight=0.20,
             ),
             matched_skills=[
-                SkillMatch(skill=s, similarity_score=score, matched=True)
+                SkillMatch.model_construct(skill=s, similarity_score=score, matched=True)
                 for s, score in result.matched_skills
             ],
             missing_skills=result.missing_skills,
             explanation=result.explanation,
         )
+
+        if redis_client is not None:
+            try:
+                await redis_client.setex(
+                    cache_key,
+                    _CACHE_TTL_SECONDS,
+                    match_result.model_dump_json(),
+                )
+            except Exception as exc:
+                logger.debug("Match cache write failed: %s", exc)
+
+        return match_result
     except AnalyzerError as exc:
-        logger.error("Match failed: %s", exc.message)
+        # Expected 4xx-class failure — no traceback capture
+        logger.warning("Match failed: %s", exc.message)
         status = 404 if exc.code == "RESUME_NOT_FOUND" else 422
         raise HTTPException(status_code=status, detail=exc.message) from exc
     except Exception as exc:
@@ -171,7 +241,7 @@ async def health_check(
     except Exception:
         pass
 
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy",
         version=settings.app_version,
         models_loaded=models_loaded,
@@ -35,6 +35,7 @@ def get_sbert_service() -> "SBERTService":
         model_name=settings.sbert_model_name,
         device=settings.ner_device,
         batch_size=settings.batch_size,
+        backend=settings.sbert_backend,
     )
 
 
@@ -58,9 +59,22 @@ def get_faiss_store() -> "FAISSStore":
         m=settings.faiss_m,
         ef_construction=settings.faiss_ef_construction,
         ef_search=settings.faiss_ef_search,
+        index_type=settings.faiss_index_type,
+        encoder=settings.faiss_encoder,
+        ivf_nlist=settings.faiss_ivf_nlist,
+        pq_m=settings.faiss_pq_m,
+        pq_nbits=settings.faiss_pq_nbits,
+        nprobe=settings.faiss_nprobe,
+        omp_threads=settings.faiss_omp_threads,
     )
 
 
+@lru_cache(maxsize=1)
+def get_embed_coalescer():
+    from app.ml.embeddings.coalescer import EmbedCoalescer
+    return EmbedCoalescer(get_sbert_service())
+
+
 @lru_cache(maxsize=1)
 def get_skill_normalizer() -> "SkillNormalizer":
     from app.services.skill_normalizer import SkillNormalizer
@@ -72,9 +86,54 @@ def get_skill_normalizer() -> "SkillNormalizer":
         sbert_service=sbert,
         faiss_store=faiss_store,
         similarity_threshold=settings.skill_similarity_threshold,
+        index_path=settings.faiss_index_path,
+        coalescer=get_embed_coalescer(),
+        embedding_cache_dir=settings.data_dir / "cache",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_db_engine():
+    """
+    Async SQLAlchemy engine with explicit pool configuration, or None
+    when sqlalchemy/asyncpg are not installed (they are optional
+    production dependencies, like neo4j and redis).
+
+    Pool sizing is explicit so connection setup/teardown doesn't thrash
+    under concurrency; pre_ping drops stale connections before use.
+    """
+    try:
+        from sqlalchemy.ext.asyncio import create_async_engine
+    except ImportError:
+        return None
+    settings = get_settings()
+    return create_async_engine(
+        settings.postgres_dsn,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        echo=False,
     )
 
 
+@lru_cache(maxsize=1)
+def get_redis_client():
+    """
+    Async Redis client for response caching, or None when unavailable.
+
+    Redis is optional (same as Neo4j) — if the package is not installed
+    the caller simply skips caching. Connection errors surface per
+    command and are handled at the call site.
+    """
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        return None
+    settings = get_settings()
+    return aioredis.from_url(settings.redis_url)
+
+
 @lru_cache(maxsize=1)
 def get_graph_service() -> "GraphService":
     from app.graph.graph_service import GraphService
@@ -0,0 +1,53 @@
+"""
+Optional JIT-compiled kernels for graph similarity math.
+
+Numba is deliberately *not* a hard dependency — mirroring how Neo4j is
+optional in graph_service. When numba is installed, the sorted-array
+intersection used by the bulk match path is compiled to native code
+(two-pointer scan, no per-element Python dispatch). Without numba we
+fall back to np.intersect1d, which is already C-level but pays for a
+sort-merge and temporary arrays per call.
+"""
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _intersect_count_numpy(a: np.ndarray, b: np.ndarray) -> int:
+    """Fallback: count common elements of two sorted unique arrays."""
+    return int(np.intersect1d(a, b, assume_unique=True).size)
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def intersect_count(a: np.ndarray, b: np.ndarray) -> int:  # pragma: no cover
+        """Count common elements of two sorted unique int arrays."""
+        i = 0
+        j = 0
+        count = 0
+        while i < a.size and j < b.size:
+            if a[i] == b[j]:
+                count += 1
+                i += 1
+                j += 1
+            elif a[i] < b[j]:
+                i += 1
+            else:
+                j += 1
+        return count
+
+    logger.debug("numba available — using JIT intersect kernel")
+else:
+    intersect_count = _intersect_count_numpy
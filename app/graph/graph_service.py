@@ -12,9 +12,13 @@ functional in lightweight deployments while being Neo4j-ready.
 """
 from __future__ import annotations
 
+import itertools
 import logging
-from typing import Optional
+from typing import Collection, Optional
 
+import numpy as np
+
+from app.graph._fast import intersect_count
 from app.graph.models import (
     EdgeType,
     GraphEdge,
@@ -74,9 +78,10 @@ class GraphService:
 
     def build_skill_graph(
         self,
-        resume_skills: list[str],
-        job_skills: list[str],
+        resume_skills: Collection[str],
+        job_skills: Collection[str],
         skill_categories: Optional[dict[str, str]] = None,
+        build_related_edges: bool = False,
     ) -> SkillGraph:
         """
         Build a bipartite-ish skill graph for resume–job matching.
@@ -87,12 +92,18 @@ class GraphService:
 
         Edges:
             - RELATED_TO between skills that co-occur in resume and job
+              (only when build_related_edges=True — similarity scoring
+              never inspects them, so they are O(k²) allocations needed
+              only for Neo4j materialization)
             - BELONGS_TO from skill to its category (if categories provided)
 
         Args:
-            resume_skills: Canonical skill names from the resume.
-            job_skills: Required + preferred skills from the JD.
+            resume_skills: Canonical skill names from the resume. Pass a
+                set/frozenset to avoid a defensive copy.
+            job_skills: Required + preferred skills from the JD (same).
             skill_categories: Optional mapping of skill → category.
+            build_related_edges: Materialize pairwise RELATED_TO edges
+                between overlapping skills (enable for push_to_neo4j).
 
         Returns:
             Populated SkillGraph.
@@ -100,63 +111,80 @@ class GraphService:
         graph = SkillGraph()
         categories = skill_categories or {}
 
-        # Create skill nodes
-        all_skills = set(resume_skills) | set(job_skills)
+        resume_set = resume_skills if isinstance(resume_skills, (set, frozenset)) else set(resume_skills)
+        job_set = job_skills if isinstance(job_skills, (set, frozenset)) else set(job_skills)
+
+        # Cache lowercased skill sets for O(1) similarity computation later
+        graph.resume_skill_lc = frozenset(s.lower() for s in resume_set)
+        graph.job_skill_lc = frozenset(s.lower() for s in job_set)
+
+        # Create skill nodes. Each id is formatted exactly once here —
+        # .lower() + f-string per use site adds up across the loops below.
+        all_skills = resume_set | job_set
+        skill_ids: dict[str, str] = {s: f"skill:{s.lower()}" for s in all_skills}
         for skill in all_skills:
             node = GraphNode(
-                id=f"skill:{skill.lower()}",
+                id=skill_ids[skill],
                 node_type=NodeType.SKILL,
                 label=skill,
                 properties={
-                    "in_resume": skill in resume_skills,
-                    "in_job": skill in job_skills,
+                    "in_resume": skill in resume_set,
+                    "in_job": skill in job_set,
                 },
             )
             graph.add_node(node)
 
-        # Create category nodes and edges
+        # Create category nodes and edges; record category membership
+        # per side as we go so compute_graph_similarity never re-traverses.
         if categories:
-            seen_categories: set[str] = set()
+            cat_ids: dict[str, str] = {}
             for skill in all_skills:
                 cat = categories.get(skill, "Unknown")
-                cat_id = f"category:{cat.lower()}"
-                if cat_id not in seen_categories:
+                cat_id = cat_ids.get(cat)
+                if cat_id is None:
+                    cat_id = cat_ids[cat] = f"category:{cat.lower()}"
                     graph.add_node(GraphNode(
                         id=cat_id,
                         node_type=NodeType.CATEGORY,
                         label=cat,
                     ))
-                    seen_categories.add(cat_id)
                 graph.add_edge(GraphEdge(
-                    source_id=f"skill:{skill.lower()}",
+                    source_id=skill_ids[skill],
                     target_id=cat_id,
                     edge_type=EdgeType.BELONGS_TO,
                 ))
-
-        # Create RELATED_TO edges between overlapping skills
-        overlap = set(resume_skills) & set(job_skills)
-        overlap_list = sorted(overlap)
-        for i, s1 in enumerate(overlap_list):
-            for s2 in overlap_list[i + 1:]:
-                graph.add_edge(GraphEdge(
-                    source_id=f"skill:{s1.lower()}",
-                    target_id=f"skill:{s2.lower()}",
+                if skill in resume_set:
+                    graph.resume_categories.add(cat_id)
+                if skill in job_set:
+                    graph.job_categories.add(cat_id)
+
+        # Create RELATED_TO edges between overlapping skills.
+        # Skipped by default: k·(k-1)/2 edge allocations that only the
+        # Neo4j push path ever reads.
+        if build_related_edges:
+            overlap_list = sorted(resume_set & job_set)
+            related = [
+                GraphEdge(
+                    source_id=skill_ids[s1],
+                    target_id=skill_ids[s2],
                     edge_type=EdgeType.RELATED_TO,
                     weight=1.0,
-                ))
+                )
+                for s1, s2 in itertools.combinations(overlap_list, 2)
+            ]
+            graph.edges.extend(related)
+            for edge in related:
+                graph._adjacency.setdefault(edge.source_id, []).append(
+                    (edge.target_id, edge.weight)
+                )
 
-        logger.info(
+        logger.debug(
             "Built skill graph: %d nodes, %d edges",
             len(graph.nodes), len(graph.edges),
         )
         return graph
 
-    def compute_graph_similarity(
-        self,
-        graph: SkillGraph,
-        resume_skills: list[str],
-        job_skills: list[str],
-    ) -> float:
+    def compute_graph_similarity(self, graph: SkillGraph) -> float:
         """
         Compute graph-based similarity score.
 
@@ -165,14 +193,19 @@ class GraphService:
         2. Category overlap bonus (shared categories boost score)
         3. Graph connectivity score (dense connections = better fit)
 
+        All inputs were normalized once at build_skill_graph time; this
+        method is pure set arithmetic over the graph's cached sets.
+
         Returns:
             Float in [0, 1].
         """
-        if not job_skills:
-            return 0.0
+        # All sets were precomputed at build_skill_graph time — similarity
+        # is four C-level set operations, no node/neighbor traversal.
+        resume_set = graph.resume_skill_lc
+        job_set = graph.job_skill_lc
 
-        resume_set = {s.lower() for s in resume_skills}
-        job_set = {s.lower() for s in job_skills}
+        if not job_set:
+            return 0.0
 
         # 1. Jaccard overlap
         intersection = resume_set & job_set
@@ -183,22 +216,12 @@ class GraphService:
         coverage = len(intersection) / len(job_set) if job_set else 0.0
 
         # 3. Category overlap bonus
-        resume_categories = set()
-        job_categories = set()
-        for nid, node in graph.nodes.items():
-            if node.node_type == NodeType.SKILL:
-                neighbors = graph.get_neighbors(nid)
-                for neighbor_id, _ in neighbors:
-                    neighbor_node = graph.nodes.get(neighbor_id)
-                    if neighbor_node and neighbor_node.node_type == NodeType.CATEGORY:
-                        if node.properties.get("in_resume"):
-                            resume_categories.add(neighbor_id)
-                        if node.properties.get("in_job"):
-                            job_categories.add(neighbor_id)
-
         cat_overlap = 0.0
-        if job_categories:
-            cat_overlap = len(resume_categories & job_categories) / len(job_categories)
+        if graph.job_categories:
+            cat_overlap = (
+                len(graph.resume_categories & graph.job_categories)
+                / len(graph.job_categories)
+            )
 
         # Weighted combination
         score = 0.4 * coverage + 0.35 * jaccard + 0.25 * cat_overlap
@@ -209,6 +232,76 @@ class GraphService:
         )
         return min(score, 1.0)
 
+    @staticmethod
+    def has_category_info(skill_categories: Optional[dict[str, str]]) -> bool:
+        """True when at least one skill carries a real (non-"Unknown") category."""
+        return bool(skill_categories) and any(
+            cat != "Unknown" for cat in skill_categories.values()
+        )
+
+    @staticmethod
+    def compute_set_similarity(
+        resume_skills: Collection[str],
+        job_skills: Collection[str],
+    ) -> float:
+        """
+        Graph-equivalent similarity without building a graph.
+
+        When no skill has category information, the graph collapses to
+        skill-set overlap plus a degenerate single-"Unknown"-category
+        bonus — this computes the identical score directly from the sets,
+        skipping all node/edge allocation.
+
+        Returns:
+            Float in [0, 1], equal to compute_graph_similarity on the
+            graph build_skill_graph would have produced.
+        """
+        resume_set = {s.lower() for s in resume_skills}
+        job_set = {s.lower() for s in job_skills}
+        if not job_set:
+            return 0.0
+
+        intersection = resume_set & job_set
+        union = resume_set | job_set
+        jaccard = len(intersection) / len(union) if union else 0.0
+        coverage = len(intersection) / len(job_set)
+        # Every skill lands in "Unknown", so the graph path sees full
+        # category overlap whenever the resume has any skill at all
+        cat_overlap = 1.0 if resume_set else 0.0
+
+        score = 0.4 * coverage + 0.35 * jaccard + 0.25 * cat_overlap
+        return min(score, 1.0)
+
+    @staticmethod
+    def compute_overlap_scores_batch(
+        resume_ids: "np.ndarray",
+        job_id_arrays: list["np.ndarray"],
+    ) -> list[tuple[float, float]]:
+        """
+        Vectorized Jaccard/coverage for one resume against many jobs.
+
+        Operates on sorted int32 skill-id arrays (see
+        SkillNormalizer.skill_id_array) so each overlap is a linear merge
+        scan instead of Python set hashing — a wash for a single job, but
+        markedly faster in batch mode. With numba installed the scan is
+        JIT-compiled (see app.graph._fast).
+
+        Returns:
+            One (jaccard, coverage) pair per job id array.
+        """
+        scores: list[tuple[float, float]] = []
+        n_resume = len(resume_ids)
+        for job_ids in job_id_arrays:
+            n_job = len(job_ids)
+            if n_job == 0:
+                scores.append((0.0, 0.0))
+                continue
+            n_common = intersect_count(resume_ids, job_ids)
+            n_union = n_resume + n_job - n_common
+            jaccard = n_common / n_union if n_union else 0.0
+            scores.append((jaccard, n_common / n_job))
+        return scores
+
     async def push_to_neo4j(self, graph: SkillGraph) -> bool:
         """
         Materialize the in-memory graph to Neo4j.
@@ -219,25 +312,38 @@ class GraphService:
         if driver is None:
             return False
 
+        # Group rows by label so each node/edge type is ingested with a
+        # single UNWIND query — 2·|types| round trips instead of N+E.
+        nodes_by_type: dict[str, list[dict]] = {}
+        for node in graph.nodes.values():
+            nodes_by_type.setdefault(node.node_type.value, []).append(
+                {"id": node.id, "props": node.to_cypher_props()}
+            )
+        edges_by_type: dict[str, list[dict]] = {}
+        for edge in graph.edges:
+            edges_by_type.setdefault(edge.edge_type.value, []).append({
+                "src": edge.source_id,
+                "tgt": edge.target_id,
+                "props": edge.to_cypher_props(),
+            })
+
         try:
             async with driver.session() as session:
-                # Create nodes
-                for node in graph.nodes.values():
-                    await session.run(
-                        f"MERGE (n:{node.node_type.value} {{id: $id}}) SET n += $props",
-                        id=node.id,
-                        props=node.to_cypher_props(),
-                    )
-                # Create edges
-                for edge in graph.edges:
-                    await session.run(
-                        f"MATCH (a {{id: $src}}), (b {{id: $tgt}}) "
-                        f"MERGE (a)-[r:{edge.edge_type.value}]->(b) "
-                        f"SET r += $props",
-                        src=edge.source_id,
-                        tgt=edge.target_id,
-                        props=edge.to_cypher_props(),
-                    )
+                async with await session.begin_transaction() as tx:
+                    for label, rows in nodes_by_type.items():
+                        await tx.run(
+                            f"UNWIND $rows AS row "
+                            f"MERGE (n:{label} {{id: row.id}}) SET n += row.props",
+                            rows=rows,
+                        )
+                    for rel_type, rows in edges_by_type.items():
+                        await tx.run(
+                            f"UNWIND $rows AS row "
+                            f"MATCH (a {{id: row.src}}), (b {{id: row.tgt}}) "
+                            f"MERGE (a)-[r:{rel_type}]->(b) SET r += row.props",
+                            rows=rows,
+                        )
+                    await tx.commit()
             logger.info("Graph pushed to Neo4j: %d nodes, %d edges", len(graph.nodes), len(graph.edges))
             return True
         except Exception as exc:
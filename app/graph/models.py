@@ -13,6 +13,7 @@ Graph Schema:
 """
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
@@ -32,24 +33,26 @@ class EdgeType(str, Enum):
     REQUIRES_SKILL = "REQUIRES_SKILL"
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """A node in the skill knowledge graph."""
 
     id: str
     node_type: NodeType
-    properties: dict[str, Any] = field(default_factory=dict)
+    # None (not {}) default: most nodes carry no properties, so the dict
+    # is only allocated when a caller actually sets one.
+    properties: Optional[dict[str, Any]] = None
     label: Optional[str] = None  # Display name
 
     def to_cypher_props(self) -> dict:
         """Serialize to Neo4j-compatible property dict."""
-        props = {"id": self.id, **self.properties}
+        props = {"id": self.id, **(self.properties or {})}
         if self.label:
             props["name"] = self.label
         return props
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphEdge:
     """A directed edge in the knowledge graph."""
 
@@ -57,11 +60,11 @@ class GraphEdge:
     target_id: str
     edge_type: EdgeType
     weight: float = 1.0
-    properties: dict[str, Any] = field(default_factory=dict)
+    properties: Optional[dict[str, Any]] = None
 
     def to_cypher_props(self) -> dict:
         """Serialize to Neo4j-compatible property dict."""
-        return {"weight": self.weight, **self.properties}
+        return {"weight": self.weight, **(self.properties or {})}
 
 
 @dataclass
@@ -78,9 +81,21 @@ class SkillGraph:
     _adjacency: dict[str, list[tuple[str, float]]] = field(
         default_factory=dict, repr=False
     )
+    # Node ids indexed by type, maintained in add_node — avoids scanning
+    # every node and comparing node_type on repeated type-filtered queries.
+    _by_type: dict[NodeType, set[str]] = field(
+        default_factory=lambda: defaultdict(set), repr=False
+    )
+    # Precomputed at build time so similarity queries are pure set ops
+    # instead of re-deriving membership from a node/neighbor traversal.
+    resume_skill_lc: frozenset[str] = frozenset()
+    job_skill_lc: frozenset[str] = frozenset()
+    resume_categories: set[str] = field(default_factory=set)
+    job_categories: set[str] = field(default_factory=set)
 
     def add_node(self, node: GraphNode) -> None:
         self.nodes[node.id] = node
+        self._by_type[node.node_type].add(node.id)
         if node.id not in self._adjacency:
             self._adjacency[node.id] = []
 
@@ -95,8 +110,9 @@ class SkillGraph:
         return self._adjacency.get(node_id, [])
 
     def get_skill_ids(self) -> set[str]:
-        """Return IDs of all Skill-type nodes."""
-        return {
-            nid for nid, node in self.nodes.items()
-            if node.node_type == NodeType.SKILL
-        }
+        """Return IDs of all Skill-type nodes (O(1) — maintained by add_node)."""
+        return self._by_type[NodeType.SKILL]
+
+    def get_ids_by_type(self, node_type: NodeType) -> set[str]:
+        """Return IDs of all nodes of the given type."""
+        return self._by_type[node_type]
@@ -14,7 +14,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import get_settings
 from app.core.exceptions import AnalyzerError
@@ -45,15 +45,36 @@ async def lifespan(app: FastAPI):
     if not settings.debug:
         try:
             logger.info("Pre-loading ML models...")
-            from app.core.dependencies import get_sbert_service, get_skill_extractor
+            from app.core.dependencies import (
+                get_sbert_service,
+                get_skill_extractor,
+                get_skill_normalizer,
+            )
             get_sbert_service().encode("warmup")  # Trigger lazy load
             get_skill_extractor().extract_rule_based("warmup")
+            get_skill_normalizer().initialize()  # Build FAISS ontology index
             logger.info("ML models pre-loaded successfully")
         except Exception as exc:
             logger.warning("Model pre-loading failed (will load on first request): %s", exc)
 
+    # Warm the DB pool so the first request doesn't pay connection setup
+    # (best-effort — the engine is None when sqlalchemy isn't installed)
+    from app.core.dependencies import get_db_engine
+    engine = get_db_engine()
+    if engine is not None:
+        try:
+            from sqlalchemy import text
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            logger.info("Database pool warmed")
+        except Exception as exc:
+            logger.warning("Database preflight failed: %s", exc)
+
     yield  # Application runs here
 
+    if engine is not None:
+        await engine.dispose()
+
     logger.info("Shutting down %s", settings.app_name)
 
 
@@ -69,6 +90,10 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        # orjson serializes responses several times faster than stdlib json
+        # and emits bytes directly — matters for MatchResult payloads with
+        # many SkillMatch entries.
+        default_response_class=ORJSONResponse,
     )
 
     # ── Middleware ─────────────────────────────────────────────────────
@@ -83,7 +108,7 @@ def create_app() -> FastAPI:
     # ── Exception Handlers ────────────────────────────────────────────
     @app.exception_handler(AnalyzerError)
     async def analyzer_error_handler(request: Request, exc: AnalyzerError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": exc.code,
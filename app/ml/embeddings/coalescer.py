@@ -0,0 +1,101 @@
+"""
+Cross-request embedding micro-batcher.
+
+Under concurrent API load, each request encodes its own handful of skill
+strings — the model launch and padding overhead dominate those tiny
+batches. The coalescer accumulates strings arriving within a short
+window into one SBERT batch, runs it off the event loop, and scatters
+the vectors back to the awaiting requests.
+
+Purely additive: synchronous callers keep using SBERTService.encode
+directly; only async entry points route through the coalescer.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.ml.embeddings.sbert_service import SBERTService
+
+logger = logging.getLogger(__name__)
+
+
+class EmbedCoalescer:
+    """
+    Coalesces concurrent embedding requests into shared SBERT batches.
+
+    A single background task drains a queue of (text, future) pairs:
+    it collects up to max_batch strings or whatever arrives within
+    max_wait_ms of the first one, encodes the deduplicated batch in a
+    worker thread, and resolves each future with its vector.
+    """
+
+    def __init__(
+        self,
+        sbert_service: "SBERTService",
+        max_batch: int = 256,
+        max_wait_ms: float = 10.0,
+    ):
+        self._sbert = sbert_service
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue = None  # created on first use, on the loop
+        self._worker: asyncio.Task = None
+
+    async def encode(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode texts, sharing the model batch with concurrent callers.
+
+        Returns:
+            np.ndarray of shape (len(texts), dim), rows in input order.
+        """
+        if not texts:
+            return self._sbert.encode(texts)
+
+        loop = asyncio.get_running_loop()
+        self._ensure_worker(loop)
+
+        futures = [loop.create_future() for _ in texts]
+        for text, future in zip(texts, futures):
+            self._queue.put_nowait((text, future))
+        vectors = await asyncio.gather(*futures)
+        return np.stack(vectors)
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            unique = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                # Worker thread: the forward pass must not block the loop
+                embeddings = await loop.run_in_executor(None, self._sbert.encode, unique)
+            except Exception as exc:  # propagate to every waiter
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            by_text = {text: embeddings[i] for i, text in enumerate(unique)}
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(by_text[text])
@@ -16,6 +16,7 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from app.core.exceptions import ModelLoadError
+from app.ml.similarity import cosine_similarity_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -33,24 +34,75 @@ class SBERTService:
         device: str = "cpu",
         batch_size: int = 32,
         normalize: bool = True,
+        cache_size: int = 50_000,
+        quantize: bool = False,
+        backend: str = "torch",
     ):
         self._model_name = model_name
         self._device = device
+        self._backend = backend
         self._batch_size = batch_size
         self._normalize = normalize
+        # int8 quantization: embeddings are only used for cosine ranking,
+        # so a symmetric scale (x127 on normalized vectors) quarters the
+        # bytes moved per similarity call at negligible ranking cost.
+        # Off by default — FAISS indexing expects float32.
+        self._quantize = quantize and normalize
+        # Pick the similarity kernel once — the configuration never
+        # changes after construction, so there's no reason to re-branch
+        # on it per call.
+        if self._quantize:
+            self._similarity_impl = self._similarity_int8
+        elif normalize:
+            self._similarity_impl = self._similarity_normalized
+        else:
+            self._similarity_impl = self._similarity_manual
         self._model: Optional[SentenceTransformer] = None
+        # Per-string embedding cache. The skill vocabulary is small and
+        # heavily repeated ("python", "aws", ...), so in steady state most
+        # encode() calls never touch the transformer. The cache is scoped
+        # to this instance, so entries can't outlive a model/config change.
+        self._cache: dict[str, np.ndarray] = {}
+        self._cache_size = cache_size
 
     def _load_model(self) -> None:
-        """Lazy-load the SBERT model."""
+        """
+        Lazy-load the SBERT model.
+
+        The backend option selects sentence-transformers' inference
+        runtime: "onnx" (ONNX Runtime with graph optimizations, typically
+        2-4x faster on CPU) or "openvino" need the corresponding optional
+        extras installed and fall back to the default "torch" backend
+        with a warning when they aren't.
+        """
         if self._model is not None:
             return
         try:
-            logger.info("Loading SBERT model: %s on %s", self._model_name, self._device)
-            self._model = SentenceTransformer(self._model_name, device=self._device)
+            logger.info(
+                "Loading SBERT model: %s on %s (backend=%s)",
+                self._model_name, self._device, self._backend,
+            )
+            try:
+                self._model = SentenceTransformer(
+                    self._model_name, device=self._device, backend=self._backend
+                )
+            except Exception as exc:
+                if self._backend == "torch":
+                    raise
+                logger.warning(
+                    "SBERT backend %r unavailable (%s) — falling back to torch",
+                    self._backend, exc,
+                )
+                self._model = SentenceTransformer(self._model_name, device=self._device)
             logger.info("SBERT model loaded (dim=%d)", self.dimension)
         except Exception as exc:
             raise ModelLoadError(self._model_name, str(exc)) from exc
 
+    @property
+    def model_name(self) -> str:
+        """Return the configured model name (used in cache keys)."""
+        return self._model_name
+
     @property
     def dimension(self) -> int:
         """Return the embedding dimensionality."""
@@ -77,26 +129,58 @@ class SBERTService:
 
         if isinstance(texts, str):
             texts = [texts]
-
-        embeddings = self._model.encode(
-            texts,
-            batch_size=self._batch_size,
-            show_progress_bar=show_progress,
-            convert_to_numpy=True,
-            normalize_embeddings=self._normalize,
-        )
-
-        # Ensure float32 for FAISS compatibility
-        embeddings = embeddings.astype(np.float32)
-
-        logger.debug("Encoded %d texts → shape %s", len(texts), embeddings.shape)
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        # Only novel strings go through the transformer; everything else
+        # is served from the cache. dict.fromkeys dedupes while keeping
+        # first-seen order stable.
+        missing = list(dict.fromkeys(t for t in texts if t not in self._cache))
+        if missing:
+            # Length-sort anything spanning multiple mini-batches so each
+            # batch pads to similar lengths. Output order doesn't matter —
+            # the result is assembled from the cache by key below.
+            if len(missing) > self._batch_size:
+                missing.sort(key=len)
+            new_embeddings = self._model.encode(
+                missing,
+                batch_size=self._batch_size,
+                show_progress_bar=show_progress,
+                convert_to_numpy=True,
+                normalize_embeddings=self._normalize,
+            )
+            # C-contiguous float32 for FAISS/BLAS; unlike astype() this is
+            # a no-op when the model already returns that layout
+            new_embeddings = np.ascontiguousarray(new_embeddings, dtype=np.float32)
+            if self._quantize:
+                new_embeddings = np.clip(
+                    np.round(new_embeddings * 127), -128, 127
+                ).astype(np.int8)
+            for text, emb in zip(missing, new_embeddings):
+                self._cache[text] = emb
+            # Bounded FIFO eviction — good enough given the vocabulary is
+            # far smaller than the cap in practice.
+            while len(self._cache) > self._cache_size:
+                del self._cache[next(iter(self._cache))]
+
+        # Assemble output in original order (float32 for FAISS
+        # compatibility, int8 when quantization is enabled)
+        embeddings = np.stack([self._cache[t] for t in texts])
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Encoded %d texts (%d cache misses) → shape %s",
+                len(texts), len(missing), embeddings.shape,
+            )
         return embeddings
 
     def similarity(self, embeddings_a: np.ndarray, embeddings_b: np.ndarray) -> np.ndarray:
         """
         Compute cosine similarity matrix between two sets of embeddings.
 
-        If embeddings are L2-normalized (default), dot product == cosine similarity.
+        The implementation is chosen once in __init__ based on the
+        service's quantize/normalize configuration, so the per-call path
+        has no config branches.
 
         Args:
             embeddings_a: Shape (n, dim)
@@ -105,13 +189,27 @@ class SBERTService:
         Returns:
             Similarity matrix of shape (n, m).
         """
-        if self._normalize:
-            return embeddings_a @ embeddings_b.T
-        else:
-            # Manual cosine similarity
-            norm_a = embeddings_a / (np.linalg.norm(embeddings_a, axis=1, keepdims=True) + 1e-9)
-            norm_b = embeddings_b / (np.linalg.norm(embeddings_b, axis=1, keepdims=True) + 1e-9)
-            return norm_a @ norm_b.T
+        return self._similarity_impl(embeddings_a, embeddings_b)
+
+    @staticmethod
+    def _similarity_int8(embeddings_a: np.ndarray, embeddings_b: np.ndarray) -> np.ndarray:
+        """Quantized path: int32-accumulated dot rescaled to unit range."""
+        return (
+            embeddings_a.astype(np.int32) @ embeddings_b.astype(np.int32).T
+        ).astype(np.float32) / (127.0 * 127.0)
+
+    @staticmethod
+    def _similarity_normalized(embeddings_a: np.ndarray, embeddings_b: np.ndarray) -> np.ndarray:
+        """Normalized path: shared SIMD-dispatched kernel (app.ml.similarity)."""
+        return cosine_similarity_matrix(embeddings_a, embeddings_b)
+
+    @staticmethod
+    def _similarity_manual(embeddings_a: np.ndarray, embeddings_b: np.ndarray) -> np.ndarray:
+        """Manual cosine similarity; einsum computes the squared row norms
+        without materializing intermediate products."""
+        norm_a = np.sqrt(np.einsum("ij,ij->i", embeddings_a, embeddings_a))[:, None]
+        norm_b = np.sqrt(np.einsum("ij,ij->i", embeddings_b, embeddings_b))[:, None]
+        return (embeddings_a / (norm_a + 1e-9)) @ (embeddings_b / (norm_b + 1e-9)).T
 
     @property
     def is_loaded(self) -> bool:
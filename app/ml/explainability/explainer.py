@@ -12,12 +12,17 @@ Principles:
 """
 from __future__ import annotations
 
+import itertools
 import logging
 
 from app.models.domain import MatchScore
 
 logger = logging.getLogger(__name__)
 
+# Scores bucket to 0..10, so all possible bars are precomputed — no
+# per-skill string multiplication/concatenation while formatting.
+_BARS = ["█" * i + "░" * (10 - i) for i in range(11)]
+
 
 class MatchExplainer:
     """Generates structured and natural-language explanations for match results."""
@@ -29,6 +34,8 @@ class MatchExplainer:
         job_skills: list[str],
         job_title: str,
         weights: dict[str, float] | None = None,
+        resume_skill_set: frozenset[str] | None = None,
+        job_skill_set: frozenset[str] | None = None,
     ) -> str:
         """
         Generate a comprehensive human-readable explanation.
@@ -39,6 +46,10 @@ class MatchExplainer:
             job_skills: All required/preferred skills from JD.
             job_title: Job title for context.
             weights: Scoring weights for transparency.
+            resume_skill_set: Optional pre-built set of resume_skills —
+                the pipeline already has one, so the coverage section
+                doesn't rebuild it per call.
+            job_skill_set: Same, for job_skills.
 
         Returns:
             Formatted explanation string.
@@ -68,7 +79,11 @@ class MatchExplainer:
             sections.append(self._format_missing_skills(match_score.missing_skills))
 
         # Coverage Summary
-        sections.append(self._format_coverage(resume_skills, job_skills, match_score))
+        sections.append(self._format_coverage(
+            resume_skill_set if resume_skill_set is not None else frozenset(resume_skills),
+            job_skill_set if job_skill_set is not None else frozenset(job_skills),
+            match_score,
+        ))
 
         return "\n\n".join(sections)
 
@@ -126,29 +141,31 @@ class MatchExplainer:
     def _format_matched_skills(matched: list[tuple[str, float]]) -> str:
         if not matched:
             return "Matched Skills: None"
-        lines = ["Matched Skills:"]
-        for skill, score in sorted(matched, key=lambda x: x[1], reverse=True):
-            bar = "█" * int(score * 10) + "░" * (10 - int(score * 10))
-            lines.append(f"  [{bar}] {score:.1%}  {skill}")
-        return "\n".join(lines)
+        return "\n".join(itertools.chain(
+            ("Matched Skills:",),
+            (
+                f"  [{_BARS[min(int(score * 10), 10)]}] {score:.1%}  {skill}"
+                for skill, score in sorted(matched, key=lambda x: x[1], reverse=True)
+            ),
+        ))
 
     @staticmethod
     def _format_missing_skills(missing: list[str]) -> str:
-        lines = [f"Missing Skills ({len(missing)}):"]
-        for skill in sorted(missing):
-            lines.append(f"  ✗ {skill}")
-        return "\n".join(lines)
+        return "\n".join(itertools.chain(
+            (f"Missing Skills ({len(missing)}):",),
+            (f"  ✗ {skill}" for skill in sorted(missing)),
+        ))
 
     @staticmethod
     def _format_coverage(
-        resume_skills: list[str],
-        job_skills: list[str],
+        resume_skills: frozenset[str],
+        job_skills: frozenset[str],
         match_score: MatchScore,
     ) -> str:
         total_job = len(job_skills)
         matched_count = len(match_score.matched_skills)
         missing_count = len(match_score.missing_skills)
-        extra = len(set(resume_skills) - set(job_skills))
+        extra = len(resume_skills - job_skills)
 
         return (
             f"Coverage Summary:\n"
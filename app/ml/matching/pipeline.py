@@ -14,7 +14,10 @@ Each step delegates to a specialized service.
 """
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import numpy as np
@@ -24,7 +27,7 @@ from app.ml.explainability.explainer import MatchExplainer
 from app.ml.matching.scoring_engine import ScoringEngine
 from app.ml.ner.skill_extractor import SkillExtractor
 from app.graph.graph_service import GraphService
-from app.models.domain import MatchScore, ResumeDocument, JobDescriptionDoc
+from app.models.domain import MatchScore, NormalizedSkill, ResumeDocument, JobDescriptionDoc
 from app.services.skill_normalizer import SkillNormalizer
 
 logger = logging.getLogger(__name__)
@@ -53,12 +56,16 @@ class MatchingPipeline:
         self._graph = graph_service
         self._scorer = scoring_engine
         self._explainer = explainer or MatchExplainer()
+        # Shared worker for overlapping independent scoring stages; the
+        # SBERT forward pass releases the GIL, so the graph stage runs
+        # concurrently with it instead of after it.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="match-stage")
 
-    def extract_and_normalize_skills(self, text: str) -> list[dict]:
+    def extract_and_normalize_skills(self, text: str) -> list[NormalizedSkill]:
         """
         Run skill extraction + normalization on a text.
 
-        Returns list of normalized skill dicts.
+        Returns list of NormalizedSkill results with extraction metadata.
         """
         raw_skills = self._extractor.extract(text)
         raw_texts = [s["text"] for s in raw_skills]
@@ -71,8 +78,33 @@ class MatchingPipeline:
 
         # Merge extraction metadata with normalization results
         for norm, raw in zip(normalized, raw_skills):
-            norm["source"] = raw.get("source", "unknown")
-            norm["ner_confidence"] = raw.get("confidence", 0.0)
+            norm.source = raw.get("source", "unknown")
+            norm.ner_confidence = raw.get("confidence", 0.0)
+
+        return normalized
+
+    async def extract_and_normalize_skills_async(self, text: str) -> list[NormalizedSkill]:
+        """
+        Async variant of extract_and_normalize_skills for event-loop callers.
+
+        NER runs in the stage executor so the loop stays responsive, and
+        normalization awaits the embedding coalescer (when configured) so
+        concurrent uploads share one SBERT batch.
+        """
+        loop = asyncio.get_running_loop()
+        raw_skills = await loop.run_in_executor(self._executor, self._extractor.extract, text)
+        raw_texts = [s["text"] for s in raw_skills]
+
+        if not raw_texts:
+            logger.warning("No skills extracted from text")
+            return []
+
+        normalized = await self._normalizer.normalize_async(raw_texts)
+
+        # Merge extraction metadata with normalization results
+        for norm, raw in zip(normalized, raw_skills):
+            norm.source = raw.get("source", "unknown")
+            norm.ner_confidence = raw.get("confidence", 0.0)
 
         return normalized
 
@@ -80,6 +112,7 @@ class MatchingPipeline:
         self,
         resume: ResumeDocument,
         job: JobDescriptionDoc,
+        explain: bool = True,
     ) -> MatchScore:
         """
         Execute the full matching pipeline.
@@ -87,9 +120,12 @@ class MatchingPipeline:
         Args:
             resume: Parsed and skill-extracted resume.
             job: Job description with required skills.
+            explain: Generate the human-readable explanation. Callers
+                that only rank on the numeric score (e.g. batch scoring)
+                can pass False to skip the formatting work entirely.
 
         Returns:
-            Fully populated MatchScore with explanation.
+            Fully populated MatchScore (explanation empty when explain=False).
         """
         logger.info(
             "Starting match: resume=%s (%d skills) → job=%s (%d required + %d preferred skills)",
@@ -100,9 +136,14 @@ class MatchingPipeline:
             len(job.preferred_skills),
         )
 
-        # Collect canonical skill names
+        # Collect canonical skill names — sets built once here and passed
+        # through the graph stage, which accepts them without copying
         resume_skill_names = [s.canonical_name for s in resume.skills]
-        job_skill_names = list(set(job.required_skills + job.preferred_skills))
+        resume_skill_set = frozenset(resume_skill_names)
+        job_skill_set = frozenset(job.required_skills + job.preferred_skills)
+        job_skill_names = list(job_skill_set)
+        # Lowered once, reused everywhere a case-insensitive compare happens
+        job_skill_names_lower = [s.lower() for s in job_skill_names]
 
         if not job_skill_names:
             logger.warning("No job skills provided — returning zero score")
@@ -117,32 +158,74 @@ class MatchingPipeline:
                 fit_label="Weak Fit",
             )
 
-        # ── Stage 1: Semantic Scoring ─────────────────────────────────
-        resume_embeddings = self._sbert.encode(resume_skill_names)
-        job_embeddings = self._sbert.encode(job_skill_names)
+        # ── Stage 2 (submitted first): Graph Scoring ──────────────────
+        # Independent of the embeddings, so it runs on the worker thread
+        # while the SBERT forward pass below holds this one.
+        def _graph_stage() -> float:
+            skill_categories = {s.canonical_name: "Unknown" for s in resume.skills}
+            # All-"Unknown" categories carry no structure — the score
+            # collapses to set overlap, so skip the graph build entirely
+            if not self._graph.has_category_info(skill_categories):
+                return self._graph.compute_set_similarity(resume_skill_set, job_skill_set)
+            graph = self._graph.build_skill_graph(
+                resume_skills=resume_skill_set,
+                job_skills=job_skill_set,
+                skill_categories=skill_categories,
+            )
+            return self._graph.compute_graph_similarity(graph)
 
-        semantic_score, alignments = self._scorer.compute_semantic_score(
-            resume_embeddings, job_embeddings,
-        )
+        graph_future = self._executor.submit(_graph_stage)
 
-        # Build matched skills list from alignments
+        # ── Stage 1: Semantic Scoring ─────────────────────────────────
+        # Fast path: job skills that literally appear in the resume
+        # (case-insensitive) score 1.0 by definition — no need to run
+        # them through the model. Only the leftovers get embedded.
+        resume_lower = frozenset(s.lower() for s in resume_skill_names)
         matched_skills: list[tuple[str, float]] = []
-        similarity_threshold = 0.5
-        for job_idx, resume_idx, sim in alignments:
-            if sim >= similarity_threshold:
-                matched_skills.append((job_skill_names[job_idx], round(float(sim), 4)))
-
-        # ── Stage 2: Graph Scoring ────────────────────────────────────
-        skill_categories = {s.canonical_name: "Unknown" for s in resume.skills}
-        graph = self._graph.build_skill_graph(
-            resume_skills=resume_skill_names,
-            job_skills=job_skill_names,
-            skill_categories=skill_categories,
-        )
-        graph_score = self._graph.compute_graph_similarity(
-            graph, resume_skill_names, job_skill_names,
+        rest_job_names: list[str] = []
+        for name, name_lower in zip(job_skill_names, job_skill_names_lower):
+            if name_lower in resume_lower:
+                matched_skills.append((name, 1.0))
+            else:
+                rest_job_names.append(name)
+
+        if rest_job_names:
+            if resume.skill_embeddings is not None:
+                # Precomputed SoA matrix from process_resume — upcast the
+                # fp16 rows once for BLAS and only embed the job side.
+                resume_embeddings = np.ascontiguousarray(
+                    resume.skill_embeddings, dtype=np.float32,
+                )
+                job_embeddings = self._sbert.encode(rest_job_names)
+            else:
+                # One encode call for both sides: a single forward pass
+                # amortizes the model-invocation overhead and lets
+                # sentence-transformers length-sort the combined batch.
+                all_embeddings = self._sbert.encode(resume_skill_names + rest_job_names)
+                resume_embeddings = all_embeddings[: len(resume_skill_names)]
+                job_embeddings = all_embeddings[len(resume_skill_names):]
+
+            # Alignments below 0.5 would be dropped here anyway — let the
+            # scorer filter them before materializing the list
+            rest_score, alignments = self._scorer.compute_semantic_score(
+                resume_embeddings, job_embeddings, min_similarity=0.5,
+            )
+            matched_skills.extend(
+                (rest_job_names[job_idx], round(sim, 4))
+                for job_idx, _resume_idx, sim in alignments
+            )
+        else:
+            rest_score = 0.0
+
+        # Mean of best-match similarities over all job skills: exact
+        # matches contribute 1.0, embedded ones their rest_score mean
+        n_exact = len(job_skill_names) - len(rest_job_names)
+        semantic_score = (
+            (n_exact + rest_score * len(rest_job_names)) / len(job_skill_names)
         )
 
+        graph_score = graph_future.result()
+
         # ── Stage 3: Experience Scoring ───────────────────────────────
         experience_score = self._scorer.compute_experience_score(
             resume.experience_years,
@@ -157,14 +240,20 @@ class MatchingPipeline:
             resume_skills=resume_skill_names,
             job_skills=job_skill_names,
             matched_skills=matched_skills,
+            job_skills_lower=job_skill_names_lower,
         )
 
         # ── Generate Explanation ──────────────────────────────────────
+        if not explain:
+            return match_result
+
         match_result.explanation = self._explainer.explain(
             match_score=match_result,
             resume_skills=resume_skill_names,
             job_skills=job_skill_names,
             job_title=job.title,
+            resume_skill_set=resume_skill_set,
+            job_skill_set=job_skill_set,
             weights={
                 "semantic": self._scorer.w_semantic,
                 "graph": self._scorer.w_graph,
@@ -173,3 +262,40 @@ class MatchingPipeline:
         )
 
         return match_result
+
+    def match_batch(
+        self,
+        resume: ResumeDocument,
+        jobs: list[JobDescriptionDoc],
+        explain: bool = False,
+    ) -> list[MatchScore]:
+        """
+        Match one resume against many job descriptions.
+
+        Embeds the resume skills plus the union of all job skills in a
+        single forward pass up front; the per-job match() calls then
+        resolve every embedding from the SBERT string cache, so adding a
+        job costs set arithmetic and a small similarity matrix instead of
+        another encoder invocation.
+
+        Args:
+            resume: Parsed and skill-extracted resume.
+            jobs: Job descriptions to score against.
+            explain: Generate explanations (off by default — ranking
+                callers rarely read them).
+
+        Returns:
+            One MatchScore per job, in input order.
+        """
+        if not jobs:
+            return []
+
+        resume_skill_names = [s.canonical_name for s in resume.skills]
+        all_job_skills = {
+            s
+            for job in jobs
+            for s in itertools.chain(job.required_skills, job.preferred_skills)
+        }
+        self._sbert.encode(resume_skill_names + list(all_job_skills))
+
+        return [self.match(resume, job, explain=explain) for job in jobs]
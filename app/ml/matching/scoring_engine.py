@@ -16,6 +16,7 @@ from typing import Optional
 
 import numpy as np
 
+from app.ml.similarity import cosine_similarity_matrix
 from app.models.domain import MatchScore
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,7 @@ class ScoringEngine:
         self,
         resume_embeddings: np.ndarray,
         job_skill_embeddings: np.ndarray,
+        min_similarity: float = 0.0,
     ) -> tuple[float, list[tuple[int, int, float]]]:
         """
         Compute semantic similarity between resume skills and job skills.
@@ -67,6 +69,10 @@ class ScoringEngine:
         Args:
             resume_embeddings: (n_resume, dim) normalized embeddings.
             job_skill_embeddings: (n_job, dim) normalized embeddings.
+            min_similarity: Alignments below this are dropped, so callers
+                that only care about matches above a threshold don't pay
+                for (and re-filter) entries they will discard. The score
+                itself always averages over all job skills.
 
         Returns:
             Tuple of (score, alignment_details).
@@ -75,22 +81,27 @@ class ScoringEngine:
         if resume_embeddings.size == 0 or job_skill_embeddings.size == 0:
             return 0.0, []
 
-        # Similarity matrix: (n_job, n_resume)
-        sim_matrix = job_skill_embeddings @ resume_embeddings.T
+        # Similarity matrix: (n_job, n_resume) — SIMD kernel when simsimd
+        # is installed, plain dot product otherwise
+        sim_matrix = cosine_similarity_matrix(job_skill_embeddings, resume_embeddings)
 
-        # For each job skill, find the best matching resume skill
-        best_resume_idx = np.argmax(sim_matrix, axis=1)
-        best_scores = sim_matrix[np.arange(len(best_resume_idx)), best_resume_idx]
+        # For each job skill, find the best matching resume skill. Plain
+        # max/argmax reductions — no fancy-index gather allocation.
+        best_resume_idx = sim_matrix.argmax(axis=1)
+        best_scores = sim_matrix.max(axis=1)
 
+        keep = np.nonzero(best_scores >= min_similarity)[0] if min_similarity > 0.0 \
+            else range(len(best_scores))
         alignments = [
-            (j_idx, int(r_idx), float(score))
-            for j_idx, (r_idx, score) in enumerate(zip(best_resume_idx, best_scores))
+            (int(j), int(best_resume_idx[j]), float(best_scores[j]))
+            for j in keep
         ]
 
         # Mean of best matches, clipped to [0, 1]
         score = float(np.clip(np.mean(best_scores), 0.0, 1.0))
 
-        logger.debug("Semantic score: %.4f (from %d job skills)", score, len(best_scores))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Semantic score: %.4f (from %d job skills)", score, len(best_scores))
         return score, alignments
 
     @staticmethod
@@ -129,6 +140,7 @@ class ScoringEngine:
         resume_skills: list[str],
         job_skills: list[str],
         matched_skills: list[tuple[str, float]],
+        job_skills_lower: Optional[list[str]] = None,
     ) -> MatchScore:
         """
         Compute the weighted overall score and build the MatchScore result.
@@ -140,6 +152,9 @@ class ScoringEngine:
             resume_skills: Canonical skill names from resume.
             job_skills: All required + preferred skills from JD.
             matched_skills: List of (skill, similarity) pairs.
+            job_skills_lower: Optional pre-lowercased job_skills (aligned
+                by index) so callers that already lowered them once don't
+                pay for it again here.
 
         Returns:
             Fully populated MatchScore.
@@ -158,9 +173,13 @@ class ScoringEngine:
                 fit_label = label
                 break
 
-        # Compute missing skills
+        # Compute missing skills: one set difference over lowercase keys,
+        # with a key → original-casing map to restore the display names
+        if job_skills_lower is None:
+            job_skills_lower = [s.lower() for s in job_skills]
+        job_map = dict(zip(job_skills_lower, job_skills))
         matched_names = {s.lower() for s, _ in matched_skills}
-        missing = [s for s in job_skills if s.lower() not in matched_names]
+        missing = [job_map[k] for k in job_map.keys() - matched_names]
 
         match_score = MatchScore(
             overall=round(overall, 4),
@@ -172,7 +191,9 @@ class ScoringEngine:
             fit_label=fit_label,
         )
 
-        logger.info(
+        # Debug, not info: this fires once per match and the pipeline
+        # already logs a per-match summary line
+        logger.debug(
             "Overall score: %.4f (%s) — semantic=%.3f graph=%.3f exp=%.3f",
             overall, fit_label, semantic_score, graph_score, experience_score,
         )
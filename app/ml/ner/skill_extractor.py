@@ -17,10 +17,19 @@ import re
 from typing import Optional
 
 import torch
-from transformers import AutoModelForTokenClassification, AutoTokenizer, pipeline
+from transformers import AutoModelForTokenClassification, AutoTokenizer
 
 from app.core.exceptions import ExtractionError, ModelLoadError
 
+# Optional: Aho-Corasick automaton scans the whole lexicon in one linear
+# pass over the text. Without it, a precompiled union regex still beats
+# one search per skill.
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
 logger = logging.getLogger(__name__)
 
 # Curated skill lexicon for rule-based fallback.
@@ -66,21 +75,46 @@ class SkillExtractor:
         self._device = device
         self._confidence_threshold = confidence_threshold
         self._skill_lexicon = skill_lexicon or _SKILL_LEXICON
-        self._pipeline: Optional[pipeline] = None
+        self._tokenizer = None
+        self._model: Optional[AutoModelForTokenClassification] = None
+
+        # Build the lexicon matcher once — per-call construction (or one
+        # regex per skill) dominates extract_rule_based on long resumes.
+        if _HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for skill in self._skill_lexicon:
+                self._automaton.add_word(skill, skill)
+            self._automaton.make_automaton()
+            self._lexicon_regex = None
+        else:
+            self._automaton = None
+            # Longest-first so "machine learning" wins over any prefix
+            self._lexicon_regex = re.compile(
+                r"\b(?:"
+                + "|".join(map(re.escape, sorted(self._skill_lexicon, key=len, reverse=True)))
+                + r")\b"
+            )
 
     def _load_model(self) -> None:
-        """Lazy-load the NER pipeline. Called once on first extraction."""
-        if self._pipeline is not None:
+        """
+        Lazy-load the NER model. Called once on first extraction.
+
+        Loads the tokenizer and token-classification model directly
+        rather than through pipeline(\"ner\", ...) — the pipeline wrapper
+        adds per-call Python overhead (dict post-processing, numpy
+        round-trips) that a thin batched forward pass avoids.
+        """
+        if self._model is not None:
             return
         try:
             logger.info("Loading NER model: %s on %s", self._model_name, self._device)
-            device_id = 0 if self._device == "cuda" and torch.cuda.is_available() else -1
-            self._pipeline = pipeline(
-                "ner",
-                model=self._model_name,
-                tokenizer=self._model_name,
-                aggregation_strategy="simple",
-                device=device_id,
+            device = "cuda" if self._device == "cuda" and torch.cuda.is_available() else "cpu"
+            self._device = device
+            self._tokenizer = AutoTokenizer.from_pretrained(self._model_name, use_fast=True)
+            self._model = (
+                AutoModelForTokenClassification.from_pretrained(self._model_name)
+                .to(device)
+                .eval()
             )
             logger.info("NER model loaded successfully")
         except Exception as exc:
@@ -100,13 +134,8 @@ class SkillExtractor:
             results: list[dict] = []
             seen: set[str] = set()
 
-            for chunk in chunks:
-                entities = self._pipeline(chunk)
-                for ent in entities:
-                    label = ent.get("entity_group", ent.get("entity", ""))
-                    score = float(ent.get("score", 0.0))
-                    word = ent.get("word", "").strip()
-
+            for chunk, entities in zip(chunks, self._run_ner(chunks)):
+                for word, label, score in entities:
                     if not word or len(word) < 2:
                         continue
                     if score < self._confidence_threshold:
@@ -122,6 +151,7 @@ class SkillExtractor:
                         "label": label,
                         "confidence": round(score, 4),
                         "source": "ner",
+                        "_key": normalized,  # cached lowercase key for merging
                     })
 
             return results
@@ -129,32 +159,119 @@ class SkillExtractor:
             logger.warning("NER extraction failed: %s — falling back to rule-based", exc)
             return []
 
+    def _run_ner(self, chunks: list[str]) -> list[list[tuple[str, str, float]]]:
+        """
+        Run token classification on all chunks in one padded batch.
+
+        One tokenizer call, one forward pass under inference_mode, one
+        vectorized softmax/argmax — then consecutive tokens with the same
+        entity group are merged back into words via their character
+        offsets, mirroring the HF pipeline's aggregation_strategy="simple"
+        without its per-call post-processing overhead.
+
+        Returns, per chunk, a list of (word, entity_group, mean_score).
+        """
+        encoded = self._tokenizer(
+            chunks,
+            padding=True,
+            truncation=True,
+            max_length=512,
+            return_tensors="pt",
+            return_offsets_mapping=True,
+        )
+        offsets = encoded.pop("offset_mapping").numpy()
+        attention = encoded["attention_mask"].numpy()
+        encoded = encoded.to(self._model.device)
+
+        with torch.inference_mode():
+            logits = self._model(**encoded).logits
+        probs = logits.softmax(-1)
+        token_scores, label_ids = probs.max(-1)
+        token_scores = token_scores.cpu().numpy()
+        label_ids = label_ids.cpu().numpy()
+        id2label = self._model.config.id2label
+
+        all_entities: list[list[tuple[str, str, float]]] = []
+        for i, chunk in enumerate(chunks):
+            entities: list[tuple[str, str, float]] = []
+            # Current group: [entity_group, char_start, char_end, score_sum, n_tokens]
+            group: Optional[list] = None
+
+            def _flush() -> None:
+                if group is not None:
+                    g, start, end, total, n = group
+                    entities.append((chunk[start:end].strip(), g, float(total) / n))
+
+            for j in range(offsets.shape[1]):
+                if not attention[i, j]:
+                    break
+                start, end = offsets[i, j]
+                if start == end:  # special token ([CLS]/[SEP]/padding)
+                    continue
+                label = id2label[int(label_ids[i, j])]
+                if label == "O":
+                    _flush()
+                    group = None
+                    continue
+                entity_group = label.split("-", 1)[-1]
+                if (
+                    group is not None
+                    and group[0] == entity_group
+                    and not label.startswith("B-")
+                ):
+                    group[2] = end
+                    group[3] += token_scores[i, j]
+                    group[4] += 1
+                else:
+                    _flush()
+                    group = [entity_group, int(start), int(end), float(token_scores[i, j]), 1]
+            _flush()
+            all_entities.append(entities)
+        return all_entities
+
     def extract_rule_based(self, text: str) -> list[dict]:
         """
         Rule-based skill extraction using lexicon matching.
 
-        Uses word-boundary regex for precision. Case-insensitive.
+        Scans the whole lexicon in a single pass over the text (Aho-Corasick
+        automaton, or one precompiled union regex as fallback) with
+        word-boundary checks for precision. Case-insensitive.
         """
         text_lower = text.lower()
         results: list[dict] = []
         seen: set[str] = set()
 
-        for skill in self._skill_lexicon:
+        for skill in self._scan_lexicon(text_lower):
             if skill in seen:
                 continue
-            # Escape regex special chars in skill name
-            pattern = r"\b" + re.escape(skill) + r"\b"
-            if re.search(pattern, text_lower):
-                seen.add(skill)
-                results.append({
-                    "text": skill,
-                    "label": "SKILL",
-                    "confidence": 0.85,  # Fixed confidence for lexicon matches
-                    "source": "rule_based",
-                })
+            seen.add(skill)
+            results.append({
+                "text": skill,
+                "label": "SKILL",
+                "confidence": 0.85,  # Fixed confidence for lexicon matches
+                "source": "rule_based",
+                "_key": skill,  # lexicon entries are already lowercase
+            })
 
         return results
 
+    def _scan_lexicon(self, text_lower: str):
+        """Yield lexicon skills found in the text (may repeat)."""
+        if self._automaton is not None:
+            n = len(text_lower)
+            for end_idx, skill in self._automaton.iter(text_lower):
+                # The automaton matches substrings; enforce word boundaries
+                # manually so "java" doesn't fire inside "javascript".
+                start = end_idx - len(skill) + 1
+                if start > 0 and text_lower[start - 1].isalnum():
+                    continue
+                if end_idx + 1 < n and text_lower[end_idx + 1].isalnum():
+                    continue
+                yield skill
+        else:
+            for match in self._lexicon_regex.finditer(text_lower):
+                yield match.group(0)
+
     def extract(self, text: str) -> list[dict]:
         """
         Full hybrid extraction: NER + rule-based, deduplicated.
@@ -164,18 +281,19 @@ class SkillExtractor:
         ner_results = self.extract_ner(text)
         rule_results = self.extract_rule_based(text)
 
-        # Merge: NER results take priority
+        # Merge: NER results take priority. Both extractors cache their
+        # lowercase key in "_key" so no string is re-lowered here.
         seen_normalized: set[str] = set()
         merged: list[dict] = []
 
         for item in ner_results:
-            key = item["text"].lower().strip()
+            key = item["_key"]
             if key not in seen_normalized:
                 seen_normalized.add(key)
                 merged.append(item)
 
         for item in rule_results:
-            key = item["text"].lower().strip()
+            key = item["_key"]
             if key not in seen_normalized:
                 seen_normalized.add(key)
                 merged.append(item)
@@ -189,7 +307,7 @@ class SkillExtractor:
     @property
     def is_loaded(self) -> bool:
         """Check if the NER model is loaded."""
-        return self._pipeline is not None
+        return self._model is not None
 
     @staticmethod
     def _chunk_text(text: str, max_chars: int = 1800) -> list[str]:
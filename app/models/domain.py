@@ -13,15 +13,41 @@ from typing import Optional
 import numpy as np
 
 
+@dataclass(slots=True)
+class NormalizedSkill:
+    """One normalization result from SkillNormalizer.
+
+    slots=True: these are produced in batches of hundreds per request,
+    and slotted instances skip the per-object __dict__ (~100 bytes each)
+    while making attribute reads a fixed-offset lookup.
+
+    source/ner_confidence are filled in by the pipeline when it merges
+    extraction metadata; plain normalization leaves them at defaults.
+    """
+
+    raw: str
+    canonical: str
+    similarity: float
+    category: str
+    matched: bool
+    source: str = "unknown"
+    ner_confidence: Optional[float] = None
+
+
 @dataclass
 class Skill:
-    """Domain representation of a skill."""
+    """Domain representation of a skill.
+
+    Embeddings live on the owning document as one contiguous matrix
+    (ResumeDocument.skill_embeddings) rather than per-skill arrays —
+    matching consumes them as a block, and structure-of-arrays avoids
+    re-gathering N small ndarrays on every match.
+    """
 
     raw_text: str
     canonical_name: str
     confidence: float
     source: str  # "ner" | "rule_based"
-    embedding: Optional[np.ndarray] = field(default=None, repr=False)
 
 
 @dataclass
@@ -34,6 +60,8 @@ class ResumeDocument:
     cleaned_text: str
     skills: list[Skill] = field(default_factory=list)
     experience_years: Optional[float] = None
+    # (n_skills, dim) float16, L2-normalized, rows parallel to skills.
+    # fp16 halves store memory; consumers upcast to float32 for BLAS.
     skill_embeddings: Optional[np.ndarray] = field(default=None, repr=False)
 
 
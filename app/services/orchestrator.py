@@ -10,9 +10,15 @@ This service owns the request lifecycle; the pipeline owns the ML logic.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
+
+import numpy as np
 
 from app.core.config import get_settings
 from app.core.exceptions import AnalyzerError
@@ -30,6 +36,51 @@ from app.utils.file_utils import generate_resume_id
 logger = logging.getLogger(__name__)
 
 
+class _TTLStore:
+    """
+    Size- and TTL-bounded dict for processed resumes.
+
+    Uploads leak raw text and an embedding matrix into the process
+    forever if the store is a plain dict. Entries here expire after ttl
+    seconds and the oldest is dropped past maxsize, keeping a
+    long-running server's memory flat. Insertion order doubles as
+    expiry order (dicts are ordered and the TTL is uniform), so
+    eviction is O(evicted), not a scan.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, ResumeDocument]] = {}
+
+    def get(self, key: str) -> Optional[ResumeDocument]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: ResumeDocument) -> None:
+        self._entries.pop(key, None)  # re-insert at the back on overwrite
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._expire()
+        while len(self._entries) > self._maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for key, (expires_at, _) in list(self._entries.items()):
+            if expires_at >= now:
+                break  # uniform TTL: everything after is newer
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class Orchestrator:
     """
     Central orchestration service.
@@ -61,19 +112,33 @@ class Orchestrator:
             scoring_engine=scoring_engine,
             explainer=MatchExplainer(),
         )
-        # In-memory resume store (production: use DB)
-        self._resume_store: dict[str, ResumeDocument] = {}
+        # In-memory resume store (production: use DB). TTL/size bounded
+        # so uploads don't accumulate in RSS forever.
+        settings = get_settings()
+        self._resume_store = _TTLStore(
+            maxsize=settings.resume_cache_size,
+            ttl=settings.resume_ttl_seconds,
+        )
+        # Parsing runs off the event loop: pdf/docx extraction takes
+        # seconds and the C extractors release the GIL, so concurrent
+        # uploads parse in parallel instead of serializing the loop.
+        self._parse_executor = ThreadPoolExecutor(
+            max_workers=get_settings().parse_workers,
+            thread_name_prefix="resume-parse",
+        )
 
     async def process_resume(
         self,
-        file_bytes: bytes,
+        source: Union[bytes, BinaryIO],
         filename: str,
     ) -> ResumeDocument:
         """
         Full resume processing: parse → extract → normalize → store.
 
         Args:
-            file_bytes: Raw file content.
+            source: Raw file content (bytes) or a readable binary file
+                object (e.g. a spooled upload) — avoids forcing callers
+                to materialize large files in memory.
             filename: Original filename with extension.
 
         Returns:
@@ -82,25 +147,41 @@ class Orchestrator:
         resume_id = generate_resume_id(filename)
         logger.info("Processing resume: %s (id=%s)", filename, resume_id)
 
-        # Step 1: Parse
-        raw_text, cleaned_text, experience_years = self._parser.parse(
-            file_bytes, filename=filename,
+        # Step 1: Parse (worker thread — keeps the loop responsive)
+        raw_text, cleaned_text, experience_years = await asyncio.get_running_loop().run_in_executor(
+            self._parse_executor,
+            functools.partial(self._parser.parse, source, filename=filename),
         )
 
-        # Step 2: Extract + normalize skills
-        normalized_skills = self._pipeline.extract_and_normalize_skills(cleaned_text)
+        # Step 2: Extract + normalize skills (async path — concurrent
+        # uploads share coalesced SBERT batches)
+        normalized_skills = await self._pipeline.extract_and_normalize_skills_async(cleaned_text)
 
         # Convert to domain Skill objects
         skills = [
             Skill(
-                raw_text=ns["raw"],
-                canonical_name=ns["canonical"],
-                confidence=ns.get("ner_confidence", ns.get("similarity", 0.0)),
-                source=ns.get("source", "unknown"),
+                raw_text=ns.raw,
+                canonical_name=ns.canonical,
+                confidence=ns.ner_confidence if ns.ner_confidence is not None else ns.similarity,
+                source=ns.source,
             )
             for ns in normalized_skills
         ]
 
+        # Precompute the skill-embedding matrix once per resume (SoA,
+        # fp16 — half the resident memory of the store). The canonical
+        # names were embedded at ontology build time, so this is mostly
+        # SBERT cache hits; cold strings run in a worker thread.
+        skill_embeddings = None
+        if skills:
+            embeddings = await asyncio.get_running_loop().run_in_executor(
+                None, self._sbert.encode, [s.canonical_name for s in skills],
+            )
+            # int8-quantized services already emit compact vectors
+            if embeddings.dtype.kind == "f":
+                embeddings = embeddings.astype(np.float16)
+            skill_embeddings = embeddings
+
         # Build domain object
         resume = ResumeDocument(
             resume_id=resume_id,
@@ -109,10 +190,11 @@ class Orchestrator:
             cleaned_text=cleaned_text,
             skills=skills,
             experience_years=experience_years,
+            skill_embeddings=skill_embeddings,
         )
 
         # Store for later matching
-        self._resume_store[resume_id] = resume
+        self._resume_store.set(resume_id, resume)
         logger.info(
             "Resume stored: %s — %d skills, %.1f yrs experience",
             resume_id, len(skills), experience_years or 0.0,
@@ -152,20 +234,17 @@ class Orchestrator:
                 code="RESUME_NOT_FOUND",
             )
 
-        # Normalize JD skills through the same pipeline
-        all_jd_skills = list(set(required_skills + preferred_skills))
+        # Normalize JD skills through the same pipeline. Order-preserving:
+        # one concatenated normalize() call, split back by position —
+        # a skill that is both required and preferred lands in both
+        # lists instead of whichever `in`-scan claimed it first. The
+        # normalizer's result cache dedupes the repeated strings.
+        all_jd_skills = required_skills + preferred_skills
         if all_jd_skills:
             normalized_jd = self._normalizer.normalize(all_jd_skills)
-            required_skills = [
-                n["canonical"]
-                for n, orig in zip(normalized_jd, all_jd_skills)
-                if orig in required_skills
-            ]
-            preferred_skills = [
-                n["canonical"]
-                for n, orig in zip(normalized_jd, all_jd_skills)
-                if orig in preferred_skills
-            ]
+            split = len(required_skills)
+            required_skills = [n.canonical for n in normalized_jd[:split]]
+            preferred_skills = [n.canonical for n in normalized_jd[split:]]
 
         job = JobDescriptionDoc(
             title=job_title,
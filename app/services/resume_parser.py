@@ -10,22 +10,58 @@ from __future__ import annotations
 import io
 import logging
 from pathlib import Path
-from typing import Callable, Union
+from typing import BinaryIO, Callable, Union
 
 import pdfplumber
 from docx import Document as DocxDocument
 
+# PyMuPDF is a C extension over MuPDF and extracts plain text 5-10x
+# faster than pdfplumber's pure-Python layout analysis. Optional, like
+# neo4j/redis — without it extraction falls back to pdfplumber.
+try:
+    import fitz  # PyMuPDF
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
 from app.core.exceptions import ParsingError, UnsupportedFileTypeError
 from app.utils.file_utils import validate_file_extension
-from app.utils.text_cleaning import clean_resume_text, extract_experience_years
+from app.utils.text_cleaning import clean_and_extract
 
 logger = logging.getLogger(__name__)
 
-# Type alias for extractor functions
-ExtractorFn = Callable[[Union[Path, bytes]], str]
+# Type alias for extractor functions. Sources can be a filesystem path,
+# raw bytes, or an already-open binary file object (e.g. spooled upload).
+ResumeSource = Union[Path, bytes, BinaryIO]
+ExtractorFn = Callable[[ResumeSource], str]
+
 
+def _extract_pdf_text(source: ResumeSource) -> str:
+    """
+    Extract text from a PDF.
 
-def _extract_pdf_text(source: Union[Path, bytes]) -> str:
+    Prefers PyMuPDF (fitz), which skips layout-tree materialization when
+    only plain text is needed; falls back to pdfplumber when PyMuPDF is
+    not installed or fails on a malformed file (pdfplumber's layout
+    analysis copes better with unusual PDFs).
+    """
+    if HAS_FITZ:
+        try:
+            if isinstance(source, Path):
+                doc = fitz.open(str(source))
+            else:
+                data = source if isinstance(source, bytes) else source.read()
+                doc = fitz.open(stream=data, filetype="pdf")
+            with doc:
+                return "\n".join(page.get_text("text") for page in doc)
+        except Exception as exc:
+            logger.warning("PyMuPDF extraction failed (%s) — retrying with pdfplumber", exc)
+            if not isinstance(source, (Path, bytes)):
+                source.seek(0)
+    return _extract_pdf_text_pdfplumber(source)
+
+
+def _extract_pdf_text_pdfplumber(source: ResumeSource) -> str:
     """
     Extract text from a PDF using pdfplumber.
 
@@ -35,24 +71,31 @@ def _extract_pdf_text(source: Union[Path, bytes]) -> str:
         if isinstance(source, bytes):
             source = io.BytesIO(source)
         with pdfplumber.open(source) as pdf:
-            pages = []
+            # Stream pages into one growing buffer instead of holding a
+            # list of page strings plus the joined copy.
+            buf = io.StringIO()
             for page in pdf.pages:
                 text = page.extract_text()
                 if text:
-                    pages.append(text)
-            return "\n".join(pages)
+                    buf.write(text)
+                    buf.write("\n")
+            return buf.getvalue()
     except Exception as exc:
         raise ParsingError(f"PDF extraction failed: {exc}") from exc
 
 
-def _extract_docx_text(source: Union[Path, bytes]) -> str:
+def _extract_docx_text(source: ResumeSource) -> str:
     """Extract text from a DOCX file using python-docx."""
     try:
         if isinstance(source, bytes):
             source = io.BytesIO(source)
         doc = DocxDocument(source)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        return "\n".join(paragraphs)
+        # p.text walks the paragraph's XML runs — call it once per
+        # paragraph, and filter with isspace() (a C-level scan) instead
+        # of allocating a stripped copy that only feeds the filter.
+        return "\n".join(
+            t for p in doc.paragraphs if (t := p.text) and not t.isspace()
+        )
     except Exception as exc:
         raise ParsingError(f"DOCX extraction failed: {exc}") from exc
 
@@ -75,15 +118,15 @@ class ResumeParser:
 
     def parse(
         self,
-        source: Union[Path, bytes],
+        source: ResumeSource,
         filename: str | None = None,
     ) -> tuple[str, str, float | None]:
         """
         Parse a resume file.
 
         Args:
-            source: File path or raw bytes.
-            filename: Original filename (required if source is bytes).
+            source: File path, raw bytes, or a binary file object.
+            filename: Original filename (required unless source is a path).
 
         Returns:
             Tuple of (raw_text, cleaned_text, experience_years).
@@ -109,8 +152,7 @@ class ResumeParser:
         if not raw_text.strip():
             raise ParsingError("Extracted text is empty — file may be scanned/image-based")
 
-        cleaned_text = clean_resume_text(raw_text)
-        experience_years = extract_experience_years(cleaned_text)
+        cleaned_text, experience_years = clean_and_extract(raw_text)
 
         logger.info(
             "Parsed %d chars → %d cleaned chars, experience=%.1f yrs",
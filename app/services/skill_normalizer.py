@@ -14,13 +14,20 @@ nearest canonical skill above a similarity threshold.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from app.core.exceptions import AnalyzerError
+from app.ml.embeddings.coalescer import EmbedCoalescer
 from app.ml.embeddings.sbert_service import SBERTService
+from app.models.domain import NormalizedSkill
 from app.vectorstore.faiss_store import FAISSStore
 
 logger = logging.getLogger(__name__)
@@ -49,24 +56,57 @@ class SkillNormalizer:
         sbert_service: SBERTService,
         faiss_store: FAISSStore,
         similarity_threshold: float = 0.75,
+        index_path: Optional[Path] = None,
+        coalescer: Optional[EmbedCoalescer] = None,
+        embedding_cache_dir: Optional[Path] = None,
     ):
         self._ontology_path = ontology_path
         self._sbert = sbert_service
         self._faiss = faiss_store
+        self._coalescer = coalescer
         self._threshold = similarity_threshold
+        self._index_path = Path(index_path) if index_path else None
+        self._embedding_cache_dir = Path(embedding_cache_dir) if embedding_cache_dir else None
         self._canonical_skills: list[str] = []
         self._skill_categories: dict[str, str] = {}
+        self._skill_int_ids: dict[str, int] = {}
+        # Lowercased canonical and alias text → canonical. Checked before
+        # any model work: verbatim ontology hits (the majority on typical
+        # resumes) resolve with one dict probe instead of encode+search.
+        self._exact_map: dict[str, str] = {}
         self._initialized = False
+        self._init_lock = threading.Lock()
+        # Normalization results keyed by lowercased raw text. Extracted
+        # skills are heavy-tailed ("Python", "SQL", "AWS" dominate), so
+        # repeats skip both the embedding and the FAISS search. Unmatched
+        # entries cache canonical=None — the passthrough canonical is
+        # this call's raw string, not the cached casing.
+        self._result_cache: dict[str, tuple[Optional[str], float, str, bool]] = {}
+        self._result_cache_size = 50_000
 
     def initialize(self) -> None:
         """
         Load ontology, embed canonical skills + aliases, build FAISS index.
 
-        Called once at application startup (not per request).
+        Called once at application startup (not per request). When an
+        index_path is configured, a previously saved index is memory-
+        mapped instead of re-embedding and rebuilding the HNSW graph —
+        the dominant cold-start cost — and a fresh build is persisted
+        there for the next start.
+
+        Thread-safe: concurrent cold-start callers (e.g. parallel first
+        requests racing the lifespan warmup) block on one build instead
+        of each embedding the ontology and building a duplicate index.
         """
         if self._initialized:
             return
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._do_initialize()
 
+    def _do_initialize(self) -> None:
+        """Build or load the index. Caller must hold _init_lock."""
         ontology = self._load_ontology()
         texts_to_embed: list[str] = []
         labels: list[str] = []
@@ -74,28 +114,80 @@ class SkillNormalizer:
         for entry in ontology.get("skills", []):
             canonical = entry["canonical"]
             category = entry.get("category", "Unknown")
+            self._skill_int_ids[canonical.lower()] = len(self._canonical_skills)
             self._canonical_skills.append(canonical)
             self._skill_categories[canonical] = category
 
             # Embed the canonical name
             texts_to_embed.append(canonical)
             labels.append(canonical)
+            self._exact_map[canonical.lower()] = canonical
 
             # Also embed each alias, mapping back to canonical
             for alias in entry.get("aliases", []):
                 texts_to_embed.append(alias)
                 labels.append(canonical)
+                self._exact_map[alias.lower()] = canonical
 
         if not texts_to_embed:
             raise AnalyzerError("Ontology is empty — no skills to index")
 
-        logger.info("Embedding %d skill terms (%d canonical)", len(texts_to_embed), len(self._canonical_skills))
-        embeddings = self._sbert.encode(texts_to_embed, show_progress=True)
-        self._faiss.build_index(embeddings, labels)
+        if not self._load_saved_index(labels):
+            embeddings = self._embed_ontology(texts_to_embed)
+            self._faiss.build_index(embeddings, labels)
+            if self._index_path is not None:
+                try:
+                    self._faiss.save(self._index_path)
+                except Exception as exc:
+                    logger.warning("Failed to persist FAISS index to %s: %s", self._index_path, exc)
         self._initialized = True
         logger.info("Skill normalizer initialized with %d canonical skills", len(self._canonical_skills))
 
-    def normalize(self, raw_skills: list[str], top_k: int = 1) -> list[dict]:
+    def _embed_ontology(self, texts_to_embed: list[str]) -> np.ndarray:
+        """
+        Embed the ontology terms, through a persistent matrix cache.
+
+        The ontology is static across deploys, so the embedded matrix is
+        cached as an .npy keyed by ontology content + model name and
+        memory-mapped on later starts — skipping the SBERT pass per
+        worker, and letting worker processes share page-cache pages.
+        A key mismatch (edited ontology, different model) simply misses.
+        """
+        cache_path = self._embedding_cache_path()
+        if cache_path is not None and cache_path.exists():
+            try:
+                embeddings = np.load(cache_path, mmap_mode="r")
+                if embeddings.shape[0] == len(texts_to_embed):
+                    logger.info("Loaded cached ontology embeddings from %s", cache_path)
+                    return embeddings
+            except Exception as exc:
+                logger.warning("Failed to load embedding cache %s: %s — re-embedding", cache_path, exc)
+
+        logger.info(
+            "Embedding %d skill terms (%d canonical)",
+            len(texts_to_embed), len(self._canonical_skills),
+        )
+        embeddings = self._sbert.encode(texts_to_embed, show_progress=True)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                np.save(cache_path, embeddings)
+            except Exception as exc:
+                logger.warning("Failed to persist embedding cache to %s: %s", cache_path, exc)
+        return embeddings
+
+    def _embedding_cache_path(self) -> Optional[Path]:
+        """Cache file keyed by ontology bytes + model name, or None."""
+        if self._embedding_cache_dir is None:
+            return None
+        ontology_path = Path(self._ontology_path)
+        raw = ontology_path.read_bytes() if ontology_path.exists() else b""
+        key = hashlib.blake2b(
+            raw + self._sbert.model_name.encode(), digest_size=8,
+        ).hexdigest()
+        return self._embedding_cache_dir / f"ontology_emb_{key}.npy"
+
+    def normalize(self, raw_skills: list[str], top_k: int = 1) -> list[NormalizedSkill]:
         """
         Normalize a batch of raw skill strings.
 
@@ -104,7 +196,27 @@ class SkillNormalizer:
             top_k: Number of candidates to consider per skill.
 
         Returns:
-            List of dicts: {raw, canonical, similarity, category}
+            List of NormalizedSkill results, in input order.
+        """
+        if not self._initialized:
+            self.initialize()
+
+        if not raw_skills:
+            return []
+
+        results, misses, miss_idx = self._lookup_cached(raw_skills)
+        if misses:
+            fresh = self._match_embeddings(misses, self._sbert.encode(misses), top_k)
+            self._fill_results(results, fresh, miss_idx)
+        return results
+
+    async def normalize_async(self, raw_skills: list[str], top_k: int = 1) -> list[NormalizedSkill]:
+        """
+        Async variant of normalize() for event-loop callers.
+
+        Embeddings go through the coalescer when one is configured, so
+        concurrent requests share a single SBERT batch; without one the
+        encode runs in a worker thread to keep the loop responsive.
         """
         if not self._initialized:
             self.initialize()
@@ -112,35 +224,139 @@ class SkillNormalizer:
         if not raw_skills:
             return []
 
-        embeddings = self._sbert.encode(raw_skills)
-        search_results = self._faiss.search(embeddings, top_k=top_k)
-
-        normalized: list[dict] = []
-        for raw, candidates in zip(raw_skills, search_results):
-            if candidates and candidates[0][1] >= self._threshold:
-                best_canonical, best_score = candidates[0]
-                normalized.append({
-                    "raw": raw,
-                    "canonical": best_canonical,
-                    "similarity": round(best_score, 4),
-                    "category": self._skill_categories.get(best_canonical, "Unknown"),
-                    "matched": True,
-                })
+        results, misses, miss_idx = self._lookup_cached(raw_skills)
+        if misses:
+            if self._coalescer is not None:
+                embeddings = await self._coalescer.encode(misses)
             else:
-                # Below threshold — keep raw as canonical (unknown skill)
-                best_score = candidates[0][1] if candidates else 0.0
-                normalized.append({
-                    "raw": raw,
-                    "canonical": raw,  # Passthrough
-                    "similarity": round(best_score, 4),
-                    "category": "Unknown",
-                    "matched": False,
-                })
-
-        matched = sum(1 for n in normalized if n["matched"])
-        logger.info("Normalized %d/%d skills above threshold %.2f", matched, len(normalized), self._threshold)
+                embeddings = await asyncio.get_running_loop().run_in_executor(
+                    None, self._sbert.encode, misses,
+                )
+            fresh = self._match_embeddings(misses, embeddings, top_k)
+            self._fill_results(results, fresh, miss_idx)
+        return results
+
+    def _lookup_cached(
+        self, raw_skills: list[str],
+    ) -> tuple[list[Optional[NormalizedSkill]], list[str], list[int]]:
+        """Split raw skills into cached results and a miss list to embed."""
+        results: list[Optional[NormalizedSkill]] = [None] * len(raw_skills)
+        misses: list[str] = []
+        miss_idx: list[int] = []
+        for i, raw in enumerate(raw_skills):
+            key = raw.lower().strip()
+            canonical = self._exact_map.get(key)
+            if canonical is not None:
+                # Verbatim ontology term — no embedding needed, and by
+                # definition a perfect match.
+                results[i] = NormalizedSkill(
+                    raw=raw,
+                    canonical=canonical,
+                    similarity=1.0,
+                    category=self._skill_categories.get(canonical, "Unknown"),
+                    matched=True,
+                )
+                continue
+            hit = self._result_cache.get(key)
+            if hit is None:
+                misses.append(raw)
+                miss_idx.append(i)
+                continue
+            canonical, similarity, category, matched = hit
+            results[i] = NormalizedSkill(
+                raw=raw,
+                canonical=canonical if matched else raw,
+                similarity=similarity,
+                category=category,
+                matched=matched,
+            )
+        return results, misses, miss_idx
+
+    def _fill_results(
+        self,
+        results: list[Optional[NormalizedSkill]],
+        fresh: list[NormalizedSkill],
+        miss_idx: list[int],
+    ) -> None:
+        """Slot freshly computed entries into place and cache them."""
+        for i, entry in zip(miss_idx, fresh):
+            results[i] = entry
+            self._result_cache[entry.raw.lower().strip()] = (
+                entry.canonical if entry.matched else None,
+                entry.similarity,
+                entry.category,
+                entry.matched,
+            )
+        while len(self._result_cache) > self._result_cache_size:
+            del self._result_cache[next(iter(self._result_cache))]
+
+    def _match_embeddings(
+        self,
+        raw_skills: list[str],
+        embeddings: np.ndarray,
+        top_k: int,
+    ) -> list[NormalizedSkill]:
+        """Map embedded raw skills to canonical entries via FAISS search."""
+        scores, indices = self._faiss.search_arrays(embeddings, top_k=top_k)
+        if scores.shape[1] == 0:  # empty index — everything passes through
+            return [
+                NormalizedSkill(
+                    raw=raw, canonical=raw, similarity=0.0,
+                    category="Unknown", matched=False,
+                )
+                for raw in raw_skills
+            ]
+
+        # Vectorized top-1 resolution: threshold and label lookups happen
+        # on whole arrays; the Python loop below only assembles dicts.
+        top_idx = indices[:, 0]
+        top_scores = np.where(top_idx >= 0, scores[:, 0], 0.0)
+        matched = (top_idx >= 0) & (top_scores >= self._threshold)
+        labels = self._faiss.labels_array[np.maximum(top_idx, 0)]
+
+        normalized = [
+            NormalizedSkill(
+                raw=raw,
+                canonical=canonical if hit else raw,  # passthrough when unmatched
+                similarity=round(float(score), 4),
+                category=self._skill_categories.get(canonical, "Unknown") if hit else "Unknown",
+                matched=hit,
+            )
+            for raw, canonical, score, hit in zip(
+                raw_skills, labels, top_scores, matched.tolist(),
+            )
+        ]
+
+        # Guarded: the matched count is only worth computing when the
+        # line is actually emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            n_matched = sum(1 for n in normalized if n.matched)
+            logger.debug("Normalized %d/%d skills above threshold %.2f", n_matched, len(normalized), self._threshold)
         return normalized
 
+    def _load_saved_index(self, labels: list[str]) -> bool:
+        """
+        Try to mmap a previously persisted index instead of rebuilding.
+
+        Returns True on success. A stale index (vector count no longer
+        matching the ontology) is discarded so it gets rebuilt.
+        """
+        if self._index_path is None or not self._index_path.exists():
+            return False
+        try:
+            self._faiss.load(self._index_path, labels, mmap=True)
+        except Exception as exc:
+            logger.warning("Failed to load saved FAISS index %s: %s — rebuilding", self._index_path, exc)
+            return False
+        if self._faiss.size != len(labels):
+            logger.warning(
+                "Saved FAISS index is stale (%d vectors, ontology has %d) — rebuilding",
+                self._faiss.size, len(labels),
+            )
+            return False
+        logger.info("Loaded persisted FAISS index from %s", self._index_path)
+        return True
+
     def _load_ontology(self) -> dict:
         """Load skill ontology from JSON file."""
         path = Path(self._ontology_path)
@@ -163,3 +379,19 @@ class SkillNormalizer:
     def get_category(self, canonical_skill: str) -> str:
         """Look up the category for a canonical skill."""
         return self._skill_categories.get(canonical_skill, "Unknown")
+
+    def skill_id_array(self, skills: list[str]) -> np.ndarray:
+        """
+        Encode canonical skill names as a sorted int32 id array.
+
+        Each ontology skill gets a stable small-integer id at initialize()
+        time; names outside the ontology are dropped. The sorted arrays
+        feed vectorized set ops (np.intersect1d/union1d) in batch matching,
+        which beat per-call Python set construction when one resume is
+        scored against many job descriptions.
+        """
+        ids = {
+            sid for s in skills
+            if (sid := self._skill_int_ids.get(s.lower())) is not None
+        }
+        return np.fromiter(sorted(ids), dtype=np.int32, count=len(ids))
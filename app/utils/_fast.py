@@ -0,0 +1,129 @@
+"""
+Optional JIT-compiled kernels for text scanning.
+
+Same arrangement as app.graph._fast: numba is not a hard dependency.
+When it is installed, the experience-years scanner below is compiled
+to native code and replaces the regex engine on large documents —
+bulk reprocessing jobs spend most of their CPU there. Without numba,
+scan_experience_bytes is None and callers keep the compiled-regex path.
+"""
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Keyword literals as uint8 arrays so the scanner compares raw bytes
+# (input is lowercased UTF-8; multi-byte sequences can never collide
+# with these ASCII-only keywords).
+_YEAR = np.frombuffer(b"year", dtype=np.uint8)
+_YR = np.frombuffer(b"yr", dtype=np.uint8)
+_EXPERIENCE = np.frombuffer(b"experience", dtype=np.uint8)
+_EXP = np.frombuffer(b"exp", dtype=np.uint8)
+_OF = np.frombuffer(b"of", dtype=np.uint8)
+_IN = np.frombuffer(b"in", dtype=np.uint8)
+_WORKING = np.frombuffer(b"working", dtype=np.uint8)
+
+
+def _scan_experience_impl(data: np.ndarray) -> float:
+    """
+    Scan lowercased UTF-8 bytes for experience-years phrases.
+
+    Hand-rolled equivalent of text_cleaning._EXPERIENCE_RE: a digit run
+    followed by year/yr(s) and one of experience/exp/in/of/working, or
+    experience/exp [of] <digits> year/yr(s). Returns the maximum value
+    found, or -1.0 when nothing matches. Written with plain loops and
+    integer compares so numba can compile it in nopython mode.
+    """
+    n = data.size
+
+    def match_lit(pos: int, lit: np.ndarray) -> int:
+        """Return position after lit if it matches at pos, else -1."""
+        if pos + lit.size > n:
+            return -1
+        for k in range(lit.size):
+            if data[pos + k] != lit[k]:
+                return -1
+        return pos + lit.size
+
+    def skip_ws(pos: int) -> int:
+        while pos < n and (data[pos] == 32 or (9 <= data[pos] <= 13)):
+            pos += 1
+        return pos
+
+    def match_years_token(pos: int) -> int:
+        """year/years/yr/yrs — longest form first, optional trailing s."""
+        end = match_lit(pos, _YEAR)
+        if end < 0:
+            end = match_lit(pos, _YR)
+        if end < 0:
+            return -1
+        if end < n and data[end] == 115:  # 's'
+            end += 1
+        return end
+
+    best = -1.0
+    i = 0
+    while i < n:
+        c = data[i]
+        if 48 <= c <= 57:
+            # "<digits>+? year(s) [of] experience" or
+            # "<digits>+? year(s) in|of|working"
+            val = 0.0
+            j = i
+            while j < n and 48 <= data[j] <= 57:
+                val = val * 10.0 + (data[j] - 48)
+                j += 1
+            k = j
+            if k < n and data[k] == 43:  # '+'
+                k += 1
+            end = match_years_token(skip_ws(k))
+            if end >= 0:
+                k = skip_ws(end)
+                if (
+                    match_lit(k, _EXPERIENCE) >= 0
+                    or match_lit(k, _EXP) >= 0
+                    or match_lit(k, _WORKING) >= 0
+                    or match_lit(k, _OF) >= 0
+                    or match_lit(k, _IN) >= 0
+                ) and val > best:
+                    best = val
+            i = j
+        elif c == 101:  # 'e' — "experience [of] <digits> year(s)"
+            end = match_lit(i, _EXPERIENCE)
+            if end < 0:
+                end = match_lit(i, _EXP)
+            if end >= 0:
+                k = skip_ws(end)
+                of_end = match_lit(k, _OF)
+                if of_end >= 0:
+                    k = skip_ws(of_end)
+                if k < n and 48 <= data[k] <= 57:
+                    val = 0.0
+                    while k < n and 48 <= data[k] <= 57:
+                        val = val * 10.0 + (data[k] - 48)
+                        k += 1
+                    if k < n and data[k] == 43:  # '+'
+                        k += 1
+                    if match_years_token(skip_ws(k)) >= 0 and val > best:
+                        best = val
+            i += 1
+        else:
+            i += 1
+    return best
+
+
+if HAS_NUMBA:
+    scan_experience_bytes = njit(cache=True)(_scan_experience_impl)
+    logger.debug("numba available — using JIT experience scanner")
+else:
+    scan_experience_bytes = None
@@ -6,6 +6,7 @@ filesystem details — easier to swap with S3/GCS later.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import uuid
 from pathlib import Path
@@ -13,7 +14,17 @@ from typing import BinaryIO
 
 from app.core.exceptions import UnsupportedFileTypeError
 
-SUPPORTED_EXTENSIONS = {".pdf", ".docx"}
+# aiofiles is optional (same as redis/neo4j): with it, upload writes
+# are truly non-blocking; without it they run in a worker thread.
+try:
+    import aiofiles
+    HAS_AIOFILES = True
+except ImportError:
+    HAS_AIOFILES = False
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+_WRITE_CHUNK_SIZE = 1 << 20  # 1 MiB
 
 
 def validate_file_extension(filename: str) -> str:
@@ -23,33 +34,76 @@ def validate_file_extension(filename: str) -> str:
     Raises:
         UnsupportedFileTypeError: If file extension is not supported.
     """
-    ext = Path(filename).suffix.lower()
-    if ext not in SUPPORTED_EXTENSIONS:
-        raise UnsupportedFileTypeError(ext)
-    return ext
+    # Hot path (every upload + every parse dispatch): a suffix check on
+    # the lowered string, no Path object construction.
+    lowered = filename.lower()
+    for ext in SUPPORTED_EXTENSIONS:
+        if lowered.endswith(ext):
+            return ext
+    raise UnsupportedFileTypeError(Path(filename).suffix.lower())
 
 
 def generate_resume_id(filename: str) -> str:
-    """Generate a deterministic-ish ID combining UUID and filename hash."""
-    name_hash = hashlib.sha256(filename.encode()).hexdigest()[:8]
+    """Generate a deterministic-ish ID combining UUID and filename hash.
+
+    blake2b sized to the 4 bytes actually kept — the ID is not a
+    security boundary, so no point paying for a full SHA-256 digest
+    that gets truncated anyway. Same keyed-hash family the API layer
+    uses for cache keys.
+    """
+    name_hash = hashlib.blake2b(filename.encode(), digest_size=4).hexdigest()
     short_uuid = uuid.uuid4().hex[:8]
     return f"res_{name_hash}_{short_uuid}"
 
 
 async def save_upload(file: BinaryIO, filename: str, upload_dir: Path) -> Path:
     """
-    Persist an uploaded file to disk.
+    Persist an uploaded file to disk without blocking the event loop.
+
+    The extension is validated before anything touches the disk, and the
+    source is streamed in 1 MiB chunks rather than materialized in one
+    read. Writes go through aiofiles when installed; otherwise each
+    chunk write runs in the default executor.
 
     Args:
-        file: File-like object with read().
+        file: File-like object with read(), or raw bytes.
         filename: Original filename.
         upload_dir: Target directory.
 
     Returns:
         Path to the saved file.
+
+    Raises:
+        UnsupportedFileTypeError: If the extension is not supported.
     """
+    validate_file_extension(filename)
     upload_dir.mkdir(parents=True, exist_ok=True)
     dest = upload_dir / filename
-    content = file.read() if hasattr(file, "read") else file
-    dest.write_bytes(content if isinstance(content, bytes) else content.encode())
+
+    def _read_chunk() -> bytes:
+        if hasattr(file, "read"):
+            return file.read(_WRITE_CHUNK_SIZE)
+        return b""
+
+    loop = asyncio.get_running_loop()
+    if not hasattr(file, "read"):
+        content = file if isinstance(file, bytes) else file.encode()
+        if HAS_AIOFILES:
+            async with aiofiles.open(dest, "wb") as f:
+                await f.write(content)
+        else:
+            await loop.run_in_executor(None, dest.write_bytes, content)
+        return dest
+
+    if HAS_AIOFILES:
+        async with aiofiles.open(dest, "wb") as f:
+            while chunk := await loop.run_in_executor(None, _read_chunk):
+                await f.write(chunk)
+    else:
+        def _copy_stream() -> None:
+            with open(dest, "wb") as f:
+                while chunk := file.read(_WRITE_CHUNK_SIZE):
+                    f.write(chunk)
+
+        await loop.run_in_executor(None, _copy_stream)
     return dest
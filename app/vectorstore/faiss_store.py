@@ -12,6 +12,7 @@ skill embeddings, then queried at inference time.
 """
 from __future__ import annotations
 
+import itertools
 import logging
 from pathlib import Path
 from typing import Optional
@@ -23,6 +24,15 @@ from app.core.exceptions import VectorStoreError
 
 logger = logging.getLogger(__name__)
 
+# Below this corpus size an exact IndexFlatIP scan beats HNSW traversal
+# (compute-bound BLAS vs latency-bound random loads) and skips the
+# graph's memory overhead entirely.
+_FLAT_THRESHOLD = 10_000
+
+# Minimum vectors to train 4-bit PQ codebooks (16 centroids per
+# subquantizer; k-means wants a few dozen points per centroid).
+_FASTSCAN_MIN_TRAIN = 1_024
+
 
 class FAISSStore:
     """
@@ -40,6 +50,14 @@ class FAISSStore:
         m: int = 32,
         ef_construction: int = 200,
         ef_search: int = 64,
+        index_type: str = "hnsw",
+        encoder: str = "flat",
+        ivf_nlist: int = 256,
+        pq_m: int = 16,
+        pq_nbits: int = 8,
+        nprobe: int = 10,
+        force_hnsw: bool = False,
+        omp_threads: Optional[int] = None,
     ):
         """
         Args:
@@ -47,13 +65,42 @@ class FAISSStore:
             m: HNSW graph degree. Higher = better recall, more memory.
             ef_construction: Build-time beam width. Higher = slower build, better graph.
             ef_search: Query-time beam width. Higher = slower query, better recall.
+            index_type: "hnsw" (default) or "ivfpq". IVF-PQ compresses
+                vectors ~16x but needs >= ivf_nlist training vectors;
+                below that the store falls back to HNSW.
+            encoder: Vector storage encoding for HNSW — "flat" (fp32),
+                "sqfp16" (half memory, negligible recall loss),
+                "sq8" (quarter memory, small recall cost), or
+                "pq4fs" (4-bit PQ FastScan: SIMD LUT distance kernels,
+                ~8x compression; needs enough vectors to train, else
+                falls back to sqfp16).
+            ivf_nlist: IVF cluster count (ivfpq only).
+            pq_m: PQ subquantizer count — must divide dimension (ivfpq only).
+            pq_nbits: Bits per PQ code (ivfpq only).
+            nprobe: Query-time clusters probed (ivfpq only).
+            force_hnsw: Build the graph even below the exact-search
+                threshold (benchmarking / tests of the HNSW path).
+            omp_threads: Cap FAISS's OpenMP thread pool. None keeps the
+                library default; set it when running multiple uvicorn
+                workers so the pools don't oversubscribe the machine.
         """
         self._dimension = dimension
         self._m = m
         self._ef_construction = ef_construction
         self._ef_search = ef_search
-        self._index: Optional[faiss.IndexHNSWFlat] = None
-        self._labels: list[str] = []
+        self._index_type = index_type
+        self._encoder = encoder
+        self._ivf_nlist = ivf_nlist
+        self._pq_m = pq_m
+        self._pq_nbits = pq_nbits
+        self._nprobe = nprobe
+        self._force_hnsw = force_hnsw
+        if omp_threads is not None:
+            faiss.omp_set_num_threads(omp_threads)
+        self._index: Optional[faiss.Index] = None
+        # Object ndarray, not list: search gathers labels by fancy
+        # indexing, a C loop instead of per-index list GETITEMs.
+        self._labels: np.ndarray = np.empty(0, dtype=object)
 
     def build_index(self, embeddings: np.ndarray, labels: list[str]) -> None:
         """
@@ -77,29 +124,106 @@ class FAISSStore:
             )
 
         try:
-            # IndexHNSWFlat stores raw vectors + HNSW graph
-            # Using inner product (IP) because embeddings are L2-normalized
-            index = faiss.IndexHNSWFlat(self._dimension, self._m, faiss.METRIC_INNER_PRODUCT)
-            index.hnsw.efConstruction = self._ef_construction
-            index.hnsw.efSearch = self._ef_search
+            # Only copy when the layout actually needs fixing —
+            # ascontiguousarray on conforming input is a no-op, but the
+            # explicit check documents that no duplicate is made.
+            if embeddings.dtype != np.float32 or not embeddings.flags["C_CONTIGUOUS"]:
+                embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            # All indexes here use METRIC_INNER_PRODUCT, which is cosine
+            # only on unit vectors. SBERT output is already normalized;
+            # unnormalized producers get faiss's SIMD in-place normalize
+            # (one copy only for read-only inputs, e.g. mmapped caches).
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            if not np.allclose(norms, 1.0, atol=1e-3):
+                if not embeddings.flags.writeable:
+                    embeddings = embeddings.copy()
+                faiss.normalize_L2(embeddings)
+            index = self._create_index(n_vectors=embeddings.shape[0])
 
-            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if not index.is_trained:
+                index.train(embeddings)
             index.add(embeddings)
 
             self._index = index
-            self._labels = list(labels)
+            self._labels = np.asarray(labels, dtype=object)
 
             logger.info(
-                "FAISS HNSW index built: %d vectors, dim=%d, M=%d",
-                index.ntotal, self._dimension, self._m,
+                "FAISS index built: %d vectors, dim=%d, type=%s",
+                index.ntotal, self._dimension, type(index).__name__,
             )
         except Exception as exc:
             raise VectorStoreError(f"Index build failed: {exc}") from exc
 
+    def _create_index(self, n_vectors: int) -> faiss.Index:
+        """
+        Instantiate the configured index type.
+
+        IVF-PQ needs enough training vectors for both the coarse
+        quantizer (nlist) and each PQ codebook (2^nbits) — small corpora
+        (like the bundled skill ontology) fall back to HNSW.
+
+        Below _FLAT_THRESHOLD vectors, approximate search buys nothing:
+        a flat inner-product scan is one BLAS kernel at full FMA
+        throughput, while HNSW pays latency-bound pointer chasing plus
+        graph memory. Exact FlatIP wins on both latency and RAM there.
+        """
+        if n_vectors < _FLAT_THRESHOLD and not self._force_hnsw:
+            return faiss.IndexFlatIP(self._dimension)
+
+        if self._index_type == "ivfpq":
+            min_train = max(self._ivf_nlist, 1 << self._pq_nbits)
+            if n_vectors >= min_train:
+                index = faiss.index_factory(
+                    self._dimension,
+                    f"IVF{self._ivf_nlist},PQ{self._pq_m}x{self._pq_nbits}",
+                    faiss.METRIC_INNER_PRODUCT,
+                )
+                index.nprobe = self._nprobe
+                return index
+            logger.warning(
+                "ivfpq requested but only %d vectors (< %d needed to train) — falling back to HNSW",
+                n_vectors, min_train,
+            )
+
+        # HNSW graph over flat, scalar-quantized, or PQ FastScan vectors.
+        # Using inner product (IP) because embeddings are L2-normalized.
+        encoder = self._encoder
+        if encoder == "pq4fs":
+            # FastScan swaps fp32 FMAs for SIMD in-register LUT lookups
+            # over 4-bit PQ codes — much faster distance evaluation, at
+            # ~8x compression. FAISS's factory can't put FastScan codes
+            # under an HNSW graph, so this is an exact scan over the
+            # compressed corpus; the codebooks still need training data.
+            if n_vectors >= _FASTSCAN_MIN_TRAIN and self._dimension % 4 == 0:
+                return faiss.index_factory(
+                    self._dimension,
+                    f"PQ{self._dimension // 4}x4fs",
+                    faiss.METRIC_INNER_PRODUCT,
+                )
+            logger.warning(
+                "pq4fs requested but only %d vectors (< %d needed to train) — falling back to sqfp16",
+                n_vectors, _FASTSCAN_MIN_TRAIN,
+            )
+            encoder = "sqfp16"
+        if encoder == "sqfp16":
+            index = faiss.index_factory(
+                self._dimension, f"HNSW{self._m},SQfp16", faiss.METRIC_INNER_PRODUCT
+            )
+        elif encoder == "sq8":
+            index = faiss.index_factory(
+                self._dimension, f"HNSW{self._m},SQ8", faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            index = faiss.IndexHNSWFlat(self._dimension, self._m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = self._ef_construction
+        index.hnsw.efSearch = self._ef_search
+        return index
+
     def search(
         self,
         query_embeddings: np.ndarray,
         top_k: int = 5,
+        ef_search: Optional[int] = None,
     ) -> list[list[tuple[str, float]]]:
         """
         Search the index for nearest neighbors.
@@ -107,11 +231,53 @@ class FAISSStore:
         Args:
             query_embeddings: (n, dimension) float32 array.
             top_k: Number of results per query.
+            ef_search: Per-call HNSW beam-width override — latency-
+                sensitive lookups can drop it, bulk passes raise it.
+                Ignored by non-HNSW indexes.
 
         Returns:
             List of n result lists, each containing (label, score) tuples
             sorted by descending similarity.
 
+        Raises:
+            VectorStoreError: If index is not built.
+        """
+        scores, indices = self.search_arrays(query_embeddings, top_k=top_k, ef_search=ef_search)
+
+        # Gather labels and convert scores in bulk (C loops), leaving
+        # only per-row tuple assembly to the interpreter. FAISS marks
+        # missing results with index -1; those cells are compressed out.
+        valid = indices >= 0
+        gathered = self.labels_array[np.where(valid, indices, 0)]
+        return [
+            list(itertools.compress(zip(label_row, score_row), valid_row))
+            for label_row, score_row, valid_row in zip(
+                gathered.tolist(), scores.tolist(), valid.tolist(),
+            )
+        ]
+
+    def search_arrays(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        ef_search: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Search the index and return raw FAISS result arrays.
+
+        Batch callers that post-process results with NumPy (e.g. the
+        skill normalizer's vectorized threshold check) use this to avoid
+        materializing per-row tuple lists; look labels up via
+        labels_array. Missing results are marked with index -1.
+
+        Args:
+            query_embeddings: (n, dimension) float32 array.
+            top_k: Number of results per query.
+            ef_search: Per-call HNSW beam-width override (see search()).
+
+        Returns:
+            (scores, indices) arrays of shape (n, top_k).
+
         Raises:
             VectorStoreError: If index is not built.
         """
@@ -121,36 +287,100 @@ class FAISSStore:
         query_embeddings = np.ascontiguousarray(query_embeddings, dtype=np.float32)
         top_k = min(top_k, self._index.ntotal)
 
-        try:
-            scores, indices = self._index.search(query_embeddings, top_k)
-            results: list[list[tuple[str, float]]] = []
-
-            for row_scores, row_indices in zip(scores, indices):
-                row_results: list[tuple[str, float]] = []
-                for score, idx in zip(row_scores, row_indices):
-                    if idx < 0:  # FAISS returns -1 for missing results
-                        continue
-                    row_results.append((self._labels[idx], float(score)))
-                results.append(row_results)
-
-            return results
-        except Exception as exc:
-            raise VectorStoreError(f"Search failed: {exc}") from exc
+        params = None
+        if hasattr(self._index, "hnsw"):
+            if hasattr(faiss, "SearchParametersHNSW"):
+                # Per-call parameters instead of mutating index.hnsw:
+                # concurrent searches with different ef_search no longer
+                # race on shared index state.
+                params = faiss.SearchParametersHNSW()
+                params.efSearch = ef_search if ef_search is not None else self._ef_search
+                # A bounded result queue (capped at k) skips heap growth
+                # and pays off when k is small relative to the beam; for
+                # larger k the unbounded queue's better candidate
+                # ordering wins.
+                params.bounded_queue = top_k <= 4
+            else:
+                # Older FAISS without per-call params — fall back to
+                # mutating the index (racy only across mixed-ef callers).
+                if ef_search is not None:
+                    self._index.hnsw.efSearch = ef_search
+                self._index.hnsw.search_bounded_queue = top_k <= 4
+
+        # No try/except here: with the not-built and dtype/layout checks
+        # above, the C++ call can't fail for reasons worth translating —
+        # and the wrap costs a Python frame setup on every query. FAISS
+        # raises a plain RuntimeError if something truly unexpected
+        # happens, which the API error handler maps to a 500 like any
+        # other unhandled failure.
+        if params is not None:
+            return self._index.search(query_embeddings, top_k, params=params)
+        return self._index.search(query_embeddings, top_k)
+
+    @property
+    def labels_array(self) -> np.ndarray:
+        """Labels as an object ndarray, for fancy-indexing search results."""
+        return self._labels
+
+    @staticmethod
+    def _labels_path(path: Path) -> Path:
+        """Sidecar file holding the labels parallel to the saved index."""
+        return path.with_name(path.name + ".labels.npy")
 
     def save(self, path: Path) -> None:
-        """Persist the index to disk."""
+        """
+        Persist the index to disk, plus a .labels.npy sidecar so load()
+        can restore the label mapping without the caller re-deriving it.
+        """
         if self._index is None:
             raise VectorStoreError("No index to save")
         path.parent.mkdir(parents=True, exist_ok=True)
         faiss.write_index(self._index, str(path))
+        np.save(self._labels_path(path), self._labels, allow_pickle=True)
         logger.info("FAISS index saved to %s", path)
 
-    def load(self, path: Path, labels: list[str]) -> None:
-        """Load a pre-built index from disk."""
+    def load(self, path: Path, labels: Optional[list[str]] = None, mmap: bool = True) -> None:
+        """
+        Load a pre-built index from disk.
+
+        Args:
+            path: Index file written by save().
+            labels: Parallel label list matching the indexed vectors.
+                None (the default) reads the .labels.npy sidecar written
+                by save() — pass explicitly only for indexes built by
+                older versions without the sidecar.
+            mmap: Memory-map the index read-only (the default) instead
+                of copying it onto the heap — pages are file-backed, so
+                the kernel can evict them under pressure and multiple
+                workers share the same page-cache pages. Not every index
+                type supports mmap; unsupported ones fall back to a
+                regular read.
+        """
         if not path.exists():
             raise VectorStoreError(f"Index file not found: {path}")
-        self._index = faiss.read_index(str(path))
-        self._labels = labels
+        if mmap:
+            try:
+                self._index = faiss.read_index(
+                    str(path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+            except RuntimeError:
+                logger.debug("mmap load unsupported for %s — reading into memory", path)
+                self._index = faiss.read_index(str(path))
+        else:
+            self._index = faiss.read_index(str(path))
+        if labels is None:
+            labels_path = self._labels_path(path)
+            if not labels_path.exists():
+                raise VectorStoreError(
+                    f"Labels sidecar not found: {labels_path} — pass labels explicitly"
+                )
+            self._labels = np.load(labels_path, allow_pickle=True)
+        else:
+            self._labels = np.asarray(labels, dtype=object)
+        if len(self._labels) != self._index.ntotal:
+            raise VectorStoreError(
+                f"Label/vector count mismatch: {len(self._labels)} vs {self._index.ntotal}"
+            )
         logger.info("FAISS index loaded from %s (%d vectors)", path, self._index.ntotal)
 
     @property
@@ -8,9 +8,13 @@ Exercises the full pipeline: parse → NER → normalize → embed → graph →
 Usage:
     python scripts/e2e_test.py
 """
+import hashlib
+import inspect
 import io
 import json
 import sys
+import tempfile
+from pathlib import Path
 
 import httpx
 from docx import Document
@@ -18,6 +22,25 @@ from docx import Document
 BASE_URL = "http://127.0.0.1:8000/api/v1"
 
 
+def get_sample_resume() -> bytes:
+    """
+    Return the sample resume bytes, cached in the temp dir.
+
+    python-docx's ZIP + XML serialization costs hundreds of ms per run;
+    the output only changes when create_sample_resume does, so the cache
+    file is keyed by a hash of that function's source.
+    """
+    key = hashlib.blake2b(
+        inspect.getsource(create_sample_resume).encode(), digest_size=8,
+    ).hexdigest()
+    cache = Path(tempfile.gettempdir()) / f"e2e_resume_{key}.docx"
+    if cache.exists():
+        return cache.read_bytes()
+    resume_bytes = create_sample_resume()
+    cache.write_bytes(resume_bytes)
+    return resume_bytes
+
+
 def create_sample_resume() -> bytes:
     """Generate a sample DOCX resume in memory."""
     doc = Document()
@@ -56,15 +79,29 @@ def create_sample_resume() -> bytes:
     return buf.getvalue()
 
 
+def _make_client() -> httpx.Client:
+    """One keep-alive client for the whole run — a single TCP handshake
+    instead of connect/teardown per request. HTTP/2 when h2 is installed."""
+    try:
+        return httpx.Client(base_url=BASE_URL, http2=True, timeout=120)
+    except ImportError:  # http2 extra (h2) not installed
+        return httpx.Client(base_url=BASE_URL, timeout=120)
+
+
 def main():
     print("=" * 60)
     print("  Resume Job Fit Analyzer — End-to-End Test")
     print("=" * 60)
 
+    with _make_client() as client:
+        _run(client)
+
+
+def _run(client: httpx.Client):
     # Step 1: Health check
     print("\n[1/3] Health check...")
     try:
-        r = httpx.get(f"{BASE_URL}/health", timeout=10)
+        r = client.get("/health", timeout=10)
         health = r.json()
         print(f"  Status: {health['status']} | Version: {health['version']}")
     except httpx.ConnectError:
@@ -73,9 +110,9 @@ def main():
 
     # Step 2: Upload resume
     print("\n[2/3] Uploading sample resume...")
-    resume_bytes = create_sample_resume()
-    r = httpx.post(
-        f"{BASE_URL}/upload_resume",
+    resume_bytes = get_sample_resume()
+    r = client.post(
+        "/upload_resume",
         files={"file": ("john_doe_resume.docx", resume_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
         timeout=120,  # Model loading can take time on first call
     )
@@ -113,8 +150,8 @@ def main():
         },
     }
 
-    r = httpx.post(
-        f"{BASE_URL}/match",
+    r = client.post(
+        "/match",
         json=match_payload,
         timeout=120,
     )
@@ -16,10 +16,17 @@ from fastapi.testclient import TestClient
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """FastAPI test client."""
-    return TestClient(app)
+    """
+    FastAPI test client, shared across the module.
+
+    Module scope + the with-block means lifespan startup (model
+    pre-loading) runs exactly once for the whole file instead of per
+    test. No test here mutates app state, so sharing is safe.
+    """
+    with TestClient(app) as c:
+        yield c
 
 
 class TestHealthEndpoint:
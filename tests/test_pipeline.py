@@ -13,6 +13,7 @@ Run with: pytest tests/ -v
 """
 from __future__ import annotations
 
+import faiss
 import numpy as np
 import pytest
 
@@ -51,6 +52,21 @@ def sample_job_skills() -> list[str]:
     return ["Python", "React", "AWS", "Docker", "Machine Learning", "PostgreSQL"]
 
 
+@pytest.fixture(scope="module")
+def rng() -> np.random.Generator:
+    """Seeded generator shared by the module — deterministic test data,
+    and one Generator construction instead of per-test RandomState spins."""
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(scope="module")
+def chunked_text() -> tuple[str, list[str]]:
+    """A long sample text and its chunks, computed once for the module
+    so every assertion over the chunking shares one _chunk_text call."""
+    text = "Hello world. " * 200  # ~2600 chars
+    return text, SkillExtractor._chunk_text(text, max_chars=500)
+
+
 @pytest.fixture
 def scoring_engine() -> ScoringEngine:
     return ScoringEngine(weight_semantic=0.50, weight_graph=0.30, weight_experience=0.20)
@@ -58,9 +74,26 @@ def scoring_engine() -> ScoringEngine:
 
 @pytest.fixture
 def faiss_store() -> FAISSStore:
+    """Fresh, unbuilt store — for tests exercising build/error paths."""
     return FAISSStore(dimension=4, m=4, ef_construction=10, ef_search=5)
 
 
+@pytest.fixture(scope="module")
+def built_faiss_store(rng) -> tuple[FAISSStore, np.ndarray]:
+    """
+    A store built once with 10 labeled unit vectors, shared by every
+    read-only search test in the module. Building the index is the
+    expensive part of these tests; searches don't mutate it, so one
+    build amortizes across the file. Returns (store, embeddings) so
+    tests can query with known vectors.
+    """
+    store = FAISSStore(dimension=4, m=4, ef_construction=10, ef_search=5)
+    embeddings = rng.standard_normal((10, 4)).astype(np.float32)
+    faiss.normalize_L2(embeddings)  # in-place, no extra copy
+    store.build_index(embeddings, [f"skill_{i}" for i in range(10)])
+    return store, embeddings
+
+
 # ──────────────────────────────────────────────────────────────
 # Text Cleaning Tests
 # ──────────────────────────────────────────────────────────────
@@ -105,14 +138,8 @@ class TestTextCleaning:
 
 
 class TestFAISSStore:
-    def test_build_and_search(self, faiss_store):
-        embeddings = np.random.randn(10, 4).astype(np.float32)
-        # L2 normalize
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        embeddings = embeddings / norms
-        labels = [f"skill_{i}" for i in range(10)]
-
-        faiss_store.build_index(embeddings, labels)
+    def test_build_and_search(self, built_faiss_store):
+        faiss_store, embeddings = built_faiss_store
         assert faiss_store.is_built
         assert faiss_store.size == 10
 
@@ -124,13 +151,13 @@ class TestFAISSStore:
         assert results[0][0][0] == "skill_0"  # Top match should be itself
         assert results[0][0][1] > 0.99  # Near-perfect similarity
 
-    def test_dimension_mismatch(self, faiss_store):
-        wrong_dim = np.random.randn(5, 8).astype(np.float32)
+    def test_dimension_mismatch(self, faiss_store, rng):
+        wrong_dim = rng.standard_normal((5, 8)).astype(np.float32)
         with pytest.raises(Exception, match="Dimension mismatch"):
             faiss_store.build_index(wrong_dim, ["a"] * 5)
 
-    def test_search_before_build(self, faiss_store):
-        query = np.random.randn(1, 4).astype(np.float32)
+    def test_search_before_build(self, faiss_store, rng):
+        query = rng.standard_normal((1, 4)).astype(np.float32)
         with pytest.raises(Exception, match="not built"):
             faiss_store.search(query)
 
@@ -141,12 +168,11 @@ class TestFAISSStore:
 
 
 class TestScoringEngine:
-    def test_semantic_score_perfect_match(self, scoring_engine):
+    def test_semantic_score_perfect_match(self, scoring_engine, rng):
         """Identical embeddings should yield score ≈ 1.0."""
         dim = 8
-        embeddings = np.random.randn(5, dim).astype(np.float32)
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        embeddings = embeddings / norms
+        embeddings = rng.standard_normal((5, dim)).astype(np.float32)
+        faiss.normalize_L2(embeddings)
 
         score, alignments = scoring_engine.compute_semantic_score(embeddings, embeddings)
         assert score > 0.95
@@ -209,9 +235,8 @@ class TestSkillExtractor:
         results = extractor.extract_rule_based("The cat sat on the mat.")
         assert len(results) == 0
 
-    def test_chunk_text(self):
-        text = "Hello world. " * 200  # ~2600 chars
-        chunks = SkillExtractor._chunk_text(text, max_chars=500)
+    def test_chunk_text(self, chunked_text):
+        _, chunks = chunked_text
         assert len(chunks) > 1
         for chunk in chunks:
             assert len(chunk) <= 600  # Allow some tolerance for sentence boundaries